@@ -0,0 +1,41 @@
+"""Compare the available JSON codecs on realistic websocket payloads.
+
+Run with `python -m benchmarks.codec` from the repository root.
+"""
+
+import json
+from timeit import repeat
+
+from raven_hass.codec import CODECS
+from .fixtures import get_states_frame, state_changed_frame
+
+
+def bench(label: str, fn, number: int) -> float:
+    best = min(repeat(fn, number=number, repeat=5)) / number
+    print(f"  {label:<24} {best * 1e6:>12.1f} µs")
+    return best
+
+
+def main():
+    payloads = {
+        "get_states (2k)": (json.dumps(get_states_frame(2000)), 20),
+        "state_changed": (json.dumps(state_changed_frame()), 20000),
+    }
+
+    for name, codec_type in CODECS.items():
+        try:
+            codec = codec_type()
+        except ImportError:
+            print(f"{name}: not installed")
+            continue
+
+        print(f"{name}:")
+        for label, (text, number) in payloads.items():
+            data = text.encode()
+            decoded = codec.loads(data)
+            bench(f"loads {label}", lambda: codec.loads(data), number)
+            bench(f"dumps {label}", lambda: codec.dumps(decoded), number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+from datetime import UTC, datetime, timedelta
+from random import Random
+from typing import Any
+
+DOMAINS = [
+    (
+        "light",
+        lambda r: {
+            "brightness": r.randint(0, 255),
+            "color_mode": "brightness",
+            "supported_color_modes": ["brightness"],
+        },
+    ),
+    (
+        "sensor",
+        lambda r: {
+            "unit_of_measurement": "°C",
+            "device_class": "temperature",
+            "state_class": "measurement",
+        },
+    ),
+    ("binary_sensor", lambda r: {"device_class": "motion"}),
+    ("switch", lambda r: {}),
+    (
+        "climate",
+        lambda r: {
+            "hvac_modes": ["off", "heat", "cool"],
+            "current_temperature": r.uniform(15, 25),
+            "temperature": 21,
+            "min_temp": 7,
+            "max_temp": 35,
+        },
+    ),
+    (
+        "media_player",
+        lambda r: {
+            "device_class": "speaker",
+            "volume_level": r.random(),
+            "is_volume_muted": False,
+            "media_content_type": "music",
+            "source_list": ["TV", "Radio", "Spotify"],
+        },
+    ),
+    (
+        "weather",
+        lambda r: {
+            "temperature": 18,
+            "humidity": 60,
+            "forecast": [
+                {
+                    "condition": "sunny",
+                    "datetime": "2024-01-01T12:00:00+00:00",
+                    "temperature": 20 + i,
+                    "templow": 10,
+                }
+                for i in range(7)
+            ],
+        },
+    ),
+    (
+        "automation",
+        lambda r: {
+            "id": str(r.random()),
+            "last_triggered": None,
+            "mode": "single",
+            "current": 0,
+        },
+    ),
+]
+
+
+def state(index: int, rng: Random) -> dict[str, Any]:
+    domain, attributes = DOMAINS[index % len(DOMAINS)]
+    changed = datetime(2024, 1, 1, tzinfo=UTC) + timedelta(
+        seconds=rng.randint(0, 86400)
+    )
+    return {
+        "entity_id": f"{domain}.entity_{index}",
+        "state": rng.choice(["on", "off", "21.5", "unavailable"]),
+        "attributes": {
+            "friendly_name": f"Entity {index}",
+            "icon": "mdi:home",
+            **attributes(rng),
+        },
+        "last_changed": changed.isoformat(),
+        "last_reported": changed.isoformat(),
+        "last_updated": changed.isoformat(),
+        "context": {
+            "id": f"01HK{index:022d}",
+            "parent_id": None,
+            "user_id": None,
+        },
+    }
+
+
+def get_states(count: int, seed: int = 0) -> list[dict[str, Any]]:
+    rng = Random(seed)
+    return [state(i, rng) for i in range(count)]
+
+
+def get_states_frame(count: int, seed: int = 0) -> dict[str, Any]:
+    return {
+        "id": 2,
+        "type": "result",
+        "success": True,
+        "result": get_states(count, seed),
+    }
+
+
+def state_changed_frame(index: int = 0, seed: int = 0) -> dict[str, Any]:
+    rng = Random(seed)
+    old = state(index, rng)
+    new = {**state(index, rng), "entity_id": old["entity_id"]}
+    return {
+        "id": 3,
+        "type": "event",
+        "event": {
+            "event_type": "state_changed",
+            "data": {"entity_id": old["entity_id"], "old_state": old, "new_state": new},
+            "origin": "LOCAL",
+            "time_fired": new["last_updated"],
+            "context": new["context"],
+        },
+    }
@@ -0,0 +1,59 @@
+"""Measure the cost of importing raven_hass and of the first entity per domain.
+
+Each sample runs in a fresh interpreter so module and schema caches are cold.
+Run with `python -m benchmarks.import_time` from the repository root.
+"""
+
+import json
+import subprocess
+import sys
+from statistics import median
+
+from .fixtures import DOMAINS
+
+PROBE = """
+import json, sys
+from time import perf_counter
+start = perf_counter()
+import raven_hass
+imported = perf_counter() - start
+states = json.loads(sys.stdin.read())
+first = {}
+for state in states:
+    start = perf_counter()
+    try:
+        raven_hass.HAEntity.resolve_entity(state)
+    except ValueError:
+        pass
+    first[state["entity_id"].split(".")[0]] = perf_counter() - start
+print(json.dumps({"import": imported, "first": first}))
+"""
+
+
+def sample(states: list[dict]) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        input=json.dumps(states),
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(output.stdout)
+
+
+def main(runs: int = 7):
+    from .fixtures import get_states
+
+    states = get_states(len(DOMAINS))
+    samples = [sample(states) for _ in range(runs)]
+
+    print(
+        f"import raven_hass       {median(s['import'] for s in samples) * 1e3:>8.1f} ms"
+    )
+    for domain, _ in DOMAINS:
+        first = median(s["first"][domain] for s in samples)
+        print(f"  first {domain:<17} {first * 1e3:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Compare per-entity resolve_entity against the compiled resolve_entities path.
+
+Run with `python -m benchmarks.resolve` from the repository root.
+"""
+
+import json
+from time import perf_counter
+
+from raven_hass import HAEntity
+from .fixtures import get_states
+
+
+def bench(label: str, fn, text: str, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        states = json.loads(text)
+        start = perf_counter()
+        fn(states)
+        best = min(best, perf_counter() - start)
+    print(f"  {label:<28} {best * 1e3:>10.1f} ms")
+    return best
+
+
+def main(count: int = 10_000):
+    text = json.dumps(get_states(count))
+    # Load every platform and build the adapter before timing either path
+    HAEntity.resolve_entities(json.loads(text))
+
+    print(f"get_states ({count}):")
+    legacy = bench(
+        "resolve_entity per item",
+        lambda states: [HAEntity.resolve_entity(state) for state in states],
+        text,
+    )
+    compiled = bench("resolve_entities", HAEntity.resolve_entities, text)
+    print(f"  speedup {legacy / compiled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,30 @@
+from typing import Any
+from . import exceptions, models
 from .base import BaseApi
-from .models import *
+from .mirror import EntityMirror, EntityChange
+from .fleet import RavenHassFleet, FleetEvent
+from .listener import ConflatingListener, Listener, OverflowPolicy
+from .exceptions import *
 
 
 class RavenHassClient(BaseApi):
     pass
+
+
+__all__ = [
+    *models.__all__,
+    *(name for name in vars(exceptions) if not name.startswith("_")),
+    "BaseApi",
+    "RavenHassClient",
+    "EntityMirror",
+    "EntityChange",
+    "RavenHassFleet",
+    "FleetEvent",
+    "ConflatingListener",
+    "Listener",
+    "OverflowPolicy",
+]
+
+
+def __getattr__(name: str) -> Any:
+    return getattr(models, name)
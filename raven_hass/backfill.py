@@ -0,0 +1,54 @@
+from datetime import UTC, datetime
+from typing import Any
+from .models import CompressedState
+
+
+def _timestamp(value: float) -> str:
+    return datetime.fromtimestamp(value, UTC).isoformat()
+
+
+def history_events(
+    history: dict[str, list[dict[str, Any]]], start: datetime
+) -> list[dict[str, Any]]:
+    """Rebuild state_changed events newer than `start` from a compressed
+    history/history_during_period result, ordered by time fired."""
+    after = start.timestamp()
+    events: list[tuple[float, dict[str, Any]]] = []
+    for entity_id, rows in history.items():
+        previous: dict[str, Any] | None = None
+        attributes: dict[str, Any] = {}
+        for row in rows:
+            state = CompressedState.model_validate(row)
+            if "attributes" in state.model_fields_set:
+                attributes = state.attributes
+
+            updated = state.last_updated or state.last_changed or 0
+            current = {
+                "entity_id": entity_id,
+                "state": state.state,
+                "attributes": attributes,
+                "last_changed": _timestamp(state.last_changed or updated),
+                "last_updated": _timestamp(updated),
+                "context": {"id": "", "parent_id": None, "user_id": None},
+            }
+            if updated > after:
+                events.append(
+                    (
+                        updated,
+                        {
+                            "event_type": "state_changed",
+                            "data": {
+                                "entity_id": entity_id,
+                                "old_state": previous,
+                                "new_state": current,
+                            },
+                            "origin": "LOCAL",
+                            "time_fired": current["last_updated"],
+                            "context": current["context"],
+                        },
+                    )
+                )
+            previous = current
+
+    events.sort(key=lambda event: event[0])
+    return [event for _, event in events]
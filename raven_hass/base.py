@@ -1,42 +1,153 @@
-from asyncio import Event, Queue, Task, create_task
+from asyncio import (
+    FIRST_COMPLETED,
+    Event,
+    Future,
+    Task,
+    create_task,
+    gather,
+    get_running_loop,
+    sleep,
+    timeout,
+    wait,
+    wait_for,
+)
+from collections import deque
+from datetime import datetime
+from concurrent.futures import Executor
 from contextlib import contextmanager
-import json
-from typing import Any, AsyncGenerator, Generator, Type, TypeVar
+from inspect import isawaitable
+from time import perf_counter
+import logging
+import re
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Generator,
+    Hashable,
+    Type,
+    TypeVar,
+)
 from urllib.parse import urlparse
-from uuid import uuid4
-from httpx import AsyncClient
-from websockets import ConnectionClosed, WebSocketClientProtocol, connect
+from httpx import AsyncBaseTransport, AsyncClient, Limits, Timeout
+from websockets import ConnectionClosed
+from websockets.asyncio.client import ClientConnection, connect
 from .models import (
     WS_MESSAGE_TYPES,
     WSMessage,
+    WSAuthRequired,
+    WSAuthResult,
+    WSResubscribed,
     WSResult,
+    WSBatchResult,
     WSEvent,
-    ENTITY_MODELS,
-    SERVICE_MODELS,
     Service,
     HAEntity,
 )
 from pydantic import BaseModel
+from .codec import JsonCodec, get_codec
+from .exceptions import (
+    AuthenticationError,
+    CommandTimeoutError,
+    ConnectionLostError,
+    RavenHassError,
+)
+from .listener import ConflatingListener, Listener, OverflowPolicy, Subscription
+from .metrics import LatencyHistogram
+from .mirror import EntityMirror
+from .offload import load_entities, load_history, load_services
+from .stream import iter_array, result_array_start
+from .transport import DEFAULT_TIMEOUT, rest_transport
+
+# Home Assistant serializes "id" then "type" first, so most frames can be routed
+# from their first few bytes without decoding the rest.
+STR_ROUTE = re.compile(r'\s*\{\s*"id"\s*:\s*(\d+)\s*,\s*"type"\s*:\s*"(\w+)"')
+BYTES_ROUTE = re.compile(STR_ROUTE.pattern.encode())
+COALESCE_VERSION = (2022, 4)
+
+
+def peek_route(frame: str | bytes) -> tuple[str, int] | None:
+    if isinstance(frame, bytes):
+        match = BYTES_ROUTE.match(frame)
+        return (match[2].decode(), int(match[1])) if match else None
+    match = STR_ROUTE.match(frame)
+    return (match[2], int(match[1])) if match else None
+
+
+logger = logging.getLogger(__name__)
+
+
+def fired_after(fired: str | None, cutoff: str | None) -> bool:
+    if not fired or not cutoff:
+        return True
+    return datetime.fromisoformat(fired) > datetime.fromisoformat(cutoff)
+
 
 TMessage = TypeVar("TMessage", bound=WSMessage)
 TResult = TypeVar("TResult", bound=BaseModel)
 
 
 class BaseApi:
-    def __init__(self, host: str, token: str):
+    def __init__(
+        self,
+        host: str,
+        token: str,
+        cache_entities: bool = False,
+        lazy_entities: bool = False,
+        codec: JsonCodec | str | None = None,
+        listener_maxsize: int = 0,
+        listener_overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        backfill_events: bool = True,
+        heartbeat_interval: float | None = 30,
+        heartbeat_timeout: float = 10,
+        command_timeout: float | None = None,
+        transport: AsyncBaseTransport | None = None,
+        rest_limits: Limits | None = None,
+        rest_timeout: Timeout | float | None = DEFAULT_TIMEOUT,
+        http2: bool | None = None,
+        max_frame_size: int | None = 64 * 2**20,
+        executor: Executor | None = None,
+        offload_threshold: int = 256 * 1024,
+    ):
         self.host = host
         self.token = token
+        self.transport = transport
+        self.rest_limits = rest_limits
+        self.rest_timeout = rest_timeout
+        self.http2 = http2
+        self.max_frame_size = max_frame_size
+        self.executor = executor
+        self.offload_threshold = offload_threshold
         self._rest_client: AsyncClient | None = None
-        self._ws_client: WebSocketClientProtocol | None = None
+        self._ws_client: ClientConnection | None = None
         self.ws_task: Task | None = None
-        self.event_queues: dict[str, tuple[str, Queue]] = {}
+        self.event_queues: dict[tuple[str, int | None], set[Listener]] = {}
+        self.listener_maxsize = listener_maxsize
+        self.listener_overflow = listener_overflow
+        self.blocked: deque[tuple[Listener, WSMessage]] = deque()
+        self.pending_commands: dict[int, Future[WSResult]] = {}
+        self.raw_commands: set[int] = set()
+        self.subscriptions: set[Subscription] = set()
+        self.resync_hooks: list[Callable[[], Awaitable[Any] | None]] = []
+        self.connection_count = 0
+        self.backfill_events = backfill_events
+        self.last_event_time: str | None = None
+        self.seen_entities: set[str] = set()
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.latency = LatencyHistogram()
+        self.command_timeout = command_timeout
         self.ws_active = Event()
+        self.ws_error: Exception | None = None
         self.hass_version: str | None = None
+        self.coalesce_messages = False
         self.ws_id = 1
-
-        ENTITY_MODELS.assign_client(self)
-        SERVICE_MODELS.assign_client(self)
-        Service.set_client(self)
+        self.lazy_entities = lazy_entities
+        self.codec = codec if isinstance(codec, JsonCodec) else get_codec(codec)
+        self.entity_cache: EntityMirror | None = (
+            EntityMirror(self) if cache_entities else None
+        )
 
     @property
     def rest(self) -> AsyncClient:
@@ -45,7 +156,7 @@ class BaseApi:
         return self._rest_client
 
     @property
-    def ws(self) -> WebSocketClientProtocol:
+    def ws(self) -> ClientConnection:
         if not self._ws_client:
             raise RuntimeError("Attempting to call uninitialized API")
         return self._ws_client
@@ -59,131 +170,663 @@ class BaseApi:
         return urlparse(self.host).scheme == "https"
 
     async def run_ws(self):
+        try:
+            await self.connect_ws()
+        except Exception as e:
+            # Terminal failure: nothing will reconnect, so wake everyone up with it
+            logger.error("Home Assistant connection failed: %r", e)
+            self.ws_error = e
+            for listener in self.listeners:
+                listener.fail(e)
+            self.fail_pending(e)
+
+    async def connect_ws(self):
         async for websocket in connect(
-            ("wss://" if self.secure else "ws://") + self.base_host + "/api/websocket"
+            ("wss://" if self.secure else "ws://") + self.base_host + "/api/websocket",
+            max_size=self.max_frame_size,
         ):
             self._ws_client = websocket
-            self.ws_active.set()
             self.ws_id = 1
+            tasks: list[Task] = []
             try:
-                async for message in websocket:
-                    try:
-                        parsed = json.loads(message)
-                        if "type" in parsed.keys():
-                            obj = WS_MESSAGE_TYPES[parsed["type"]](**parsed)
-                            for queue in self.event_queues.values():
-                                if queue[0] == obj.type:
-                                    queue[1].put_nowait(obj)
-                    except:
-                        pass
+                await self.authenticate(websocket)
+                tasks.append(create_task(self.setup_connection()))
+                if self.heartbeat_interval:
+                    tasks.append(create_task(self.heartbeat(websocket)))
+                await self.read_ws(websocket)
             except ConnectionClosed:
                 continue
             finally:
+                for task in tasks:
+                    task.cancel()
                 self._ws_client = None
                 self.ws_active.clear()
+                self.fail_pending(
+                    ConnectionLostError("Connection to Home Assistant was lost")
+                )
+
+    async def read_ws(self, websocket: ClientConnection):
+        decode = False if self.codec.binary else None
+        while True:
+            self.handle_frame(await websocket.recv(decode=decode))
+            while len(self.blocked) > 0:
+                listener, message = self.blocked.popleft()
+                await listener.put(message)
+
+    async def heartbeat(self, websocket: ClientConnection):
+        await self.ws_active.wait()
+        while True:
+            await sleep(self.heartbeat_interval)
+            started = perf_counter()
+            try:
+                await wait_for(
+                    self._send_command("ping", self.next_id()),
+                    self.heartbeat_timeout,
+                )
+            except TimeoutError:
+                # No pong in time: treat the link as dead and let run_ws reconnect
+                self.latency.record_missed()
+                websocket.transport.abort()
+                return
+            except (ConnectionClosed, ConnectionLostError):
+                return
+            self.latency.record(perf_counter() - started)
+
+    async def authenticate(self, websocket: ClientConnection):
+        WSAuthRequired(**self.codec.loads(await websocket.recv()))
+        await websocket.send(
+            self.codec.dumps({"type": "auth", "access_token": self.token})
+        )
+        result = WSAuthResult(**self.codec.loads(await websocket.recv()))
+        if not result.ok:
+            raise AuthenticationError("Failed to authenticate")
+        self.hass_version = result.ha_version
+
+    async def setup_connection(self):
+        reconnect = self.connection_count > 0
+        # Live events arriving while we resubscribe move last_event_time forward
+        since = self.last_event_time
+        targets = self.backfill_targets() if reconnect else []
+        for subscription in targets:
+            subscription.listener.hold()
+
+        try:
+            try:
+                async with timeout(self.command_timeout or self.heartbeat_timeout):
+                    await self.negotiate_features()
+                    await self.resubscribe()
+            except (ConnectionClosed, ConnectionLostError):
+                return
+            except TimeoutError:
+                # A replay that never gets answered leaves the link unusable
+                logger.warning("Home Assistant did not confirm resubscription")
+                self.ws.transport.abort()
+                return
+
+            self.connection_count += 1
+            self.ws_active.set()
+            if reconnect:
+                entity_ids: list[str] = []
+                events: list[dict[str, Any]] = []
+                if len(targets) > 0:
+                    try:
+                        entity_ids, events = await self.backfill(since)
+                    except Exception as e:
+                        logger.warning("Failed to backfill missed events: %r", e)
+                await self.release_backfill(targets, entity_ids, events)
+                targets = []
+
+                for hook in self.resync_hooks:
+                    result = hook()
+                    if isawaitable(result):
+                        await result
+        finally:
+            for subscription in targets:
+                await subscription.listener.release()
+
+    def backfill_targets(self) -> list[Subscription]:
+        if not self.backfill_events or not self.last_event_time:
+            return []
+        return [
+            subscription
+            for subscription in self.subscriptions
+            if subscription.command == "subscribe_events"
+            and subscription.kwargs.get("event_type") in (None, "state_changed")
+        ]
+
+    async def backfill(self, since: str) -> tuple[list[str], list[dict[str, Any]]]:
+        entity_ids = (
+            list(self.entity_cache.entities.keys())
+            if self.entity_cache
+            else list(self.seen_entities)
+        )
+        if len(entity_ids) == 0:
+            return [], []
+
+        # Runs after the resubscribe is confirmed and lets the server pick the
+        # end of the window, so no change falls between history and live events
+        reply = await self._send_command(
+            "history/history_during_period",
+            self.next_id(),
+            _raw=self.offloading,
+            start_time=since,
+            entity_ids=entity_ids,
+            minimal_response=False,
+            no_attributes=False,
+            significant_changes_only=False,
+        )
+        events = await self.decode_reply(
+            reply, load_history, datetime.fromisoformat(since)
+        )
+        if len(events) > 0 and fired_after(
+            events[-1]["time_fired"], self.last_event_time
+        ):
+            self.last_event_time = events[-1]["time_fired"]
+        return entity_ids, events
+
+    async def release_backfill(
+        self,
+        targets: list[Subscription],
+        entity_ids: list[str],
+        events: list[dict[str, Any]],
+    ):
+        cutoff = events[-1]["time_fired"] if len(events) > 0 else None
+        queried = set(entity_ids)
+
+        # Live events already covered by the backfill would be delivered twice;
+        # entities outside the history query were not covered and always pass
+        def keep(message: Any) -> bool:
+            return (
+                not isinstance(message, WSEvent)
+                or message.event_type != "state_changed"
+                or not message.entity_id in queried
+                or fired_after(message.event.get("time_fired"), cutoff)
+            )
+
+        for subscription in targets:
+            await subscription.listener.release(
+                [
+                    WSEvent(
+                        id=subscription.id, type="event", event=event, backfilled=True
+                    )
+                    for event in events
+                ],
+                keep=keep if cutoff else None,
+            )
+
+    def on_resync(self, hook: Callable[[], Awaitable[Any] | None]):
+        self.resync_hooks.append(hook)
+
+    def fail_pending(self, error: Exception):
+        for future in self.pending_commands.values():
+            if not future.done():
+                future.set_exception(error)
+        self.pending_commands.clear()
+
+    async def resubscribe(self):
+        subscriptions = list(self.subscriptions)
+        replays = []
+        for subscription in subscriptions:
+            listener = subscription.listener
+            subscription.id = self.next_id()
+            for key in listener.keys:
+                listeners = self.event_queues.get(key)
+                if listeners != None:
+                    listeners.discard(listener)
+                    if len(listeners) == 0:
+                        del self.event_queues[key]
+            listener.keys = [(key[0], subscription.id) for key in listener.keys]
+            for key in listener.keys:
+                self.event_queues.setdefault(key, set()).add(listener)
+
+            if subscription.resync:
+                listener.offer(WSResubscribed(id=subscription.id))
+            replays.append(
+                self._send_command(
+                    subscription.command, subscription.id, **subscription.kwargs
+                )
+            )
+
+        for subscription, result in zip(subscriptions, await gather(*replays)):
+            if not result.success:
+                subscription.listener.fail(
+                    RavenHassError(f"Failed to resubscribe: {result.error}")
+                )
 
     async def __aenter__(self):
         self._rest_client = AsyncClient(
+            base_url=self.host,
             headers={
                 "Authorization": "Bearer " + self.token,
                 "Content-Type": "application/json",
-            }
+            },
+            timeout=self.rest_timeout,
+            transport=self.transport or rest_transport(self.rest_limits, self.http2),
         )
+        self.ws_error = None
         self.ws_task = create_task(self.run_ws())
-        with self.messages("auth_required", "auth_ok", "auth_invalid") as events:
-            async for event in events:
-                if event.type == "auth_required":
-                    await self.ws.send(
-                        json.dumps({"type": "auth", "access_token": self.token})
-                    )
-                else:
-                    if event.ok:
-                        self.hass_version = event.ha_version
-                        return self
-                    raise RuntimeError("Failed to authenticate")
+        await self.wait_active()
+
+        if self.entity_cache:
+            self.entity_cache.start()
+            await self.entity_cache.wait_ready()
+        return self
+
+    async def wait_active(self):
+        if self.ws_active.is_set():
+            return
+        if self.ws_error:
+            raise self.ws_error
+        if not self.ws_task:
+            await self.ws_active.wait()
+            return
+
+        ready = create_task(self.ws_active.wait())
+        await wait([ready, self.ws_task], return_when=FIRST_COMPLETED)
+        if not ready.done():
+            ready.cancel()
+            raise self.ws_error or ConnectionLostError(
+                "Connection to Home Assistant was closed"
+            )
+
+    def version_at_least(self, *version: int) -> bool:
+        if not self.hass_version:
+            return False
+        parts = re.findall(r"\d+", self.hass_version)[: len(version)]
+        return tuple(int(part) for part in parts) >= version
+
+    async def negotiate_features(self):
+        self.coalesce_messages = False
+        if self.version_at_least(*COALESCE_VERSION):
+            result = await self._send_command(
+                "supported_features",
+                self.next_id(),
+                features={"coalesce_messages": 1},
+            )
+            self.coalesce_messages = result.success
 
     async def __aexit__(self, *args, **kwargs):
-        if self._rest_client:
+        if self.entity_cache:
+            await self.entity_cache.stop()
+
+        # An injected transport is shared and closed by whoever owns it
+        if self._rest_client and not self.transport:
             await self._rest_client.aclose()
 
         if self.ws_task:
             self.ws_task.cancel()
 
+    def wants(self, type: str, id: int | None = None) -> bool:
+        if id != None:
+            if type in ("result", "pong") and id in self.pending_commands:
+                return True
+            if (type, id) in self.event_queues:
+                return True
+        return (type, None) in self.event_queues
+
+    def handle_frame(self, frame: str | bytes):
+        route = peek_route(frame)
+        if route and not self.wants(*route):
+            return
+
+        # Raw commands get the undecoded frame and parse it themselves
+        if route and route[1] in self.raw_commands:
+            future = self.pending_commands.get(route[1])
+            if future and not future.done():
+                future.set_result(frame)
+            return
+
+        try:
+            parsed = self.codec.loads(frame)
+        except:
+            return
+
+        # With coalesce_messages negotiated, one frame may carry a batch of messages
+        if isinstance(parsed, list):
+            for item in parsed:
+                self.handle_message(item)
+        else:
+            self.handle_message(parsed)
+
+    def handle_message(self, parsed: Any):
+        try:
+            if "type" in parsed.keys() and self.wants(parsed["type"], parsed.get("id")):
+                obj = WS_MESSAGE_TYPES[parsed["type"]](**parsed)
+                if obj.type == "event" and obj.event_type == "state_changed":
+                    self.last_event_time = obj.event.get("time_fired")
+                    self.seen_entities.add(obj.entity_id)
+                if obj.type in ("result", "pong"):
+                    future = self.pending_commands.pop(obj.id, None)
+                    if future and not future.done():
+                        future.set_result(obj)
+                self.dispatch(obj)
+        except:
+            pass
+
+    def dispatch(self, message: WSMessage):
+        for listener in self.event_queues.get((message.type, None), ()):
+            if not listener.offer(message):
+                self.blocked.append((listener, message))
+        if message.id != None:
+            for listener in self.event_queues.get((message.type, message.id), ()):
+                if not listener.offer(message):
+                    self.blocked.append((listener, message))
+
+    @property
+    def listeners(self) -> list[Listener]:
+        return list(
+            {listener for keyed in self.event_queues.values() for listener in keyed}
+        )
+
     @contextmanager
     def messages[
         TMessage
-    ](self, *event_types: str, _type: Type[TMessage] = None) -> Generator[
-        AsyncGenerator[TMessage, Any], Any, None
-    ]:
-        queue = Queue()
-        ids = []
-        for ev in list(set(event_types)):
-            _id = uuid4().hex
-            self.event_queues[_id] = (ev, queue)
-            ids.append(_id)
-
-        async def _listen():
-            while True:
-                yield await queue.get()
+    ](
+        self,
+        *event_types: str,
+        _id: int | None = None,
+        _type: Type[TMessage] = None,
+        _maxsize: int | None = None,
+        _overflow: OverflowPolicy | None = None,
+        _key: Callable[[TMessage], Hashable | None] | None = None,
+        _merge: Callable[[TMessage, TMessage], TMessage] | None = None,
+    ) -> Generator[Listener[TMessage], Any, None]:
+        keys = [(ev, _id) for ev in set(event_types)]
+        if _key:
+            listener = ConflatingListener(keys, _key, merge=_merge)
+        else:
+            listener = Listener(
+                keys,
+                maxsize=self.listener_maxsize if _maxsize == None else _maxsize,
+                overflow=self.listener_overflow if _overflow == None else _overflow,
+            )
+        for key in keys:
+            self.event_queues.setdefault(key, set()).add(listener)
 
         try:
-            yield _listen()
+            yield listener
         finally:
-            for i in ids:
-                del self.event_queues[i]
+            listener.close()
+            for key in listener.keys:
+                listeners = self.event_queues.get(key)
+                if listeners != None:
+                    listeners.discard(listener)
+                    if len(listeners) == 0:
+                        del self.event_queues[key]
 
-    async def send_ws(self, type: str, **kwargs) -> int:
+    def next_id(self) -> int:
         msg_id = self.ws_id
         self.ws_id += 1
+        return msg_id
+
+    async def send_ws(self, type: str, **kwargs) -> int:
+        await self.wait_active()
+        msg_id = self.next_id()
         data = {"id": msg_id, "type": type, **kwargs}
-        await self.ws_active.wait()
-        await self.ws.send(json.dumps(data))
+        await self.ws.send(self.codec.dumps(data))
         return msg_id
 
     async def send_ws_command[
         TResult
-    ](self, type: str, _type: Type[TResult] = None, **kwargs) -> WSResult[TResult]:
-        with self.messages("result", _type=WSResult) as results:
-            msg_id = await self.send_ws(
-                type, **{k: v for k, v in kwargs.items() if v != None}
+    ](
+        self,
+        type: str,
+        _type: Type[TResult] = None,
+        _id: int | None = None,
+        _timeout: float | None = None,
+        **kwargs,
+    ) -> WSResult[TResult]:
+        limit = self.command_timeout if _timeout == None else _timeout
+        try:
+            async with timeout(limit):
+                await self.wait_active()
+                return await self._send_command(
+                    type, _id if _id != None else self.next_id(), **kwargs
+                )
+        except TimeoutError as e:
+            raise CommandTimeoutError(
+                f"Home Assistant did not answer {type} within {limit}s"
+            ) from e
+
+    async def _send_command(
+        self, type: str, msg_id: int, _raw: bool = False, **kwargs
+    ) -> WSResult | str | bytes:
+        future: Future[WSResult] = get_running_loop().create_future()
+        self.pending_commands[msg_id] = future
+        if _raw:
+            self.raw_commands.add(msg_id)
+        try:
+            data = {
+                "id": msg_id,
+                "type": type,
+                **{k: v for k, v in kwargs.items() if v != None},
+            }
+            try:
+                await self.ws.send(self.codec.dumps(data))
+            except ConnectionClosed as e:
+                raise ConnectionLostError(
+                    "Connection to Home Assistant was lost"
+                ) from e
+            return await future
+        finally:
+            self.pending_commands.pop(msg_id, None)
+            self.raw_commands.discard(msg_id)
+
+    async def send_ws_batch(
+        self, commands: list[dict[str, Any]], timeout: float | None = None
+    ) -> WSBatchResult:
+        limit = self.command_timeout if timeout == None else timeout
+        await self.wait_active()
+        loop = get_running_loop()
+        pending: dict[int, Future[WSResult]] = {}
+        frames: list[str] = []
+        for command in commands:
+            msg_id = self.next_id()
+            pending[msg_id] = loop.create_future()
+            frames.append(
+                self.codec.dumps(
+                    {"id": msg_id, **{k: v for k, v in command.items() if v != None}}
+                )
             )
-            async for message in results:
-                if message.id == msg_id:
-                    return message
 
-    async def subscribe_events(self, event: str | None = None):
-        subscribe_result = await self.send_ws_command(
-            "subscribe_events", event_type=event
-        )
-        if subscribe_result.success:
+        self.pending_commands.update(pending)
+        try:
+            for index, frame in enumerate(frames):
+                try:
+                    await self.ws.send(frame)
+                except ConnectionClosed as e:
+                    # Commands that never left are reported like any other failure
+                    for future in list(pending.values())[index:]:
+                        error = ConnectionLostError(
+                            "Connection to Home Assistant was lost"
+                        )
+                        error.__cause__ = e
+                        future.set_exception(error)
+                    break
+            if len(pending) > 0:
+                await wait(pending.values(), timeout=limit)
+
+            results: list[WSResult | Exception] = []
+            for msg_id, future in pending.items():
+                if not future.done():
+                    results.append(
+                        CommandTimeoutError(
+                            f"Home Assistant did not answer command {msg_id} within {limit}s"
+                        )
+                    )
+                else:
+                    results.append(future.exception() or future.result())
+            return WSBatchResult(
+                results=[r if isinstance(r, WSResult) else None for r in results],
+                exceptions={
+                    index: result
+                    for index, result in enumerate(results)
+                    if isinstance(result, Exception)
+                },
+            )
+        finally:
+            for msg_id in pending.keys():
+                self.pending_commands.pop(msg_id, None)
+
+    async def subscribe(
+        self,
+        command: str,
+        _maxsize: int | None = None,
+        _overflow: OverflowPolicy | None = None,
+        _conflate: bool = False,
+        _resync: bool = False,
+        **kwargs,
+    ) -> AsyncGenerator[WSEvent | WSResubscribed, Any]:
+        await self.wait_active()
+        msg_id = self.next_id()
+        with self.messages(
+            "event",
+            _id=msg_id,
+            _type=WSEvent,
+            _maxsize=_maxsize,
+            _overflow=_overflow,
+            _key=WSEvent.conflation_key if _conflate else None,
+            _merge=WSEvent.merge if _conflate else None,
+        ) as messages:
             try:
-                with self.messages("event", _type=WSEvent) as messages:
-                    async for ev in messages:
-                        if ev.id == subscribe_result.id:
-                            yield ev
-            finally:
-                await self.send_ws(
-                    "unsubscribe_events", subscription=subscribe_result.id
+                subscribe_result = await self.send_ws_command(
+                    command, _id=msg_id, **kwargs
                 )
-        else:
-            raise RuntimeError("Failed to subscribe.")
+            except CommandTimeoutError:
+                # The subscription may still be created server-side after we give up
+                if self.ws_active.is_set():
+                    await self.send_ws("unsubscribe_events", subscription=msg_id)
+                raise
+            if not subscribe_result.success:
+                raise RuntimeError("Failed to subscribe.")
 
-    async def get_services(self) -> list[Service]:
-        result = await self.send_ws_command(
-            "get_services", _type=dict[str, dict[str, Any]]
+            subscription = Subscription(
+                msg_id,
+                command,
+                {k: v for k, v in kwargs.items() if v != None},
+                messages,
+                resync=_resync,
+            )
+            self.subscriptions.add(subscription)
+            try:
+                async for ev in messages:
+                    yield ev
+            finally:
+                self.subscriptions.discard(subscription)
+                if self.ws_active.is_set():
+                    try:
+                        await self.send_ws(
+                            "unsubscribe_events", subscription=subscription.id
+                        )
+                    except ConnectionClosed:
+                        pass
+
+    def subscribe_events(
+        self,
+        event: str | None = None,
+        maxsize: int | None = None,
+        overflow: OverflowPolicy | None = None,
+        conflate: bool = False,
+    ) -> AsyncGenerator[WSEvent, Any]:
+        return self.subscribe(
+            "subscribe_events",
+            _maxsize=maxsize,
+            _overflow=overflow,
+            _conflate=conflate,
+            event_type=event,
         )
-        if result.success:
-            return Service.from_services(result.result)
-        return []
-
-    async def get_entities(self) -> list[HAEntity]:
-        result = await self.send_ws_command("get_states", _type=list[dict])
-        if result.success:
-            return [HAEntity.resolve_entity(entity) for entity in result.result]
-        return []
-    
-    async def get_entity(self, id: str) -> HAEntity | None:
-        result = await self.rest.get(f"{self.host}/api/states/{id}")
+
+    def subscribe_entities(
+        self, entity_ids: list[str] | None = None
+    ) -> AsyncGenerator[WSEvent, Any]:
+        return self.subscribe("subscribe_entities", entity_ids=entity_ids)
+
+    def entity_mirror(self, entity_ids: list[str] | None = None) -> EntityMirror:
+        return EntityMirror(self, entity_ids=entity_ids)
+
+    @property
+    def offloading(self) -> bool:
+        return self.executor != None
+
+    # Large raw frames are decoded and validated on the executor; everything
+    # else, including frames that arrived coalesced and pre-decoded, runs inline
+    async def decode_reply[
+        T
+    ](
+        self, reply: WSResult | str | bytes, load: Callable[..., T], *args
+    ) -> T:
+        if (
+            self.offloading
+            and not isinstance(reply, WSResult)
+            and len(reply) >= self.offload_threshold
+        ):
+            return await get_running_loop().run_in_executor(
+                self.executor, load, reply, self.codec, *args
+            )
+        return load(reply, self.codec, *args)
+
+    async def get_services(self) -> list[Service]:
+        reply = await self.send_ws_command("get_services", _raw=self.offloading)
+        services = await self.decode_reply(reply, load_services)
+        return [service.bind(self) for service in services]
+
+    def _cache_ready(self) -> bool:
+        return self.entity_cache != None and not self.entity_cache.stale
+
+    async def get_entities(self, refresh: bool = False) -> list[HAEntity]:
+        if not refresh and self._cache_ready():
+            return list(self.entity_cache.entities.values())
+
+        reply = await self.send_ws_command("get_states", _raw=self.offloading)
+        entities = await self.decode_reply(reply, load_entities, self.lazy_entities)
+        return [entity.bind(self) if entity else None for entity in entities]
+
+    async def stream_entities(
+        self, refresh: bool = False, chunk_size: int = 500
+    ) -> AsyncGenerator[HAEntity, Any]:
+        if not refresh and self._cache_ready():
+            for entity in list(self.entity_cache.entities.values()):
+                yield entity
+            return
+
+        reply = await self.send_ws_command("get_states", _raw=True)
+        if isinstance(reply, WSResult):
+            # Coalesced frames are decoded as usual before they reach us
+            chunks = self.result_chunks(reply, chunk_size)
+        else:
+            text = reply.decode() if isinstance(reply, bytes) else reply
+            start = result_array_start(text)
+            if start != None:
+                chunks = iter_array(text, start, chunk_size)
+            else:
+                chunks = self.result_chunks(
+                    WSResult(**self.codec.loads(text)), chunk_size
+                )
+
+        for chunk in chunks:
+            for entity in HAEntity.resolve_entities(
+                chunk, lazy=self.lazy_entities, client=self
+            ):
+                if entity != None:
+                    yield entity
+            await sleep(0)
+
+    def result_chunks(
+        self, result: WSResult, chunk_size: int
+    ) -> Generator[list[Any], Any, None]:
+        if result.success and result.result:
+            for index in range(0, len(result.result), chunk_size):
+                yield result.result[index : index + chunk_size]
+
+    async def get_entity(self, id: str, refresh: bool = False) -> HAEntity | None:
+        if not refresh and self._cache_ready():
+            return self.entity_cache.get(id)
+
+        result = await self.rest.get(f"/api/states/{id}")
         if result.is_success:
-            return HAEntity.resolve_entity(result.json())
+            return HAEntity.resolve_entity(
+                self.codec.loads(result.content),
+                lazy=self.lazy_entities,
+                client=self,
+            )
         return None
@@ -0,0 +1,80 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class JsonCodec:
+    name = "json"
+    binary = False
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, data: Any) -> str:
+        return json.dumps(data)
+
+    # Rebuilt by name so codecs holding native encoders can cross process pools
+    def __reduce__(self):
+        return get_codec, (self.name,)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+    binary = True
+
+    def __init__(self):
+        if not orjson:
+            raise ImportError("orjson is not installed")
+
+    def loads(self, data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, data: Any) -> str:
+        return orjson.dumps(data).decode()
+
+
+class MsgspecCodec(JsonCodec):
+    name = "msgspec"
+    binary = True
+
+    def __init__(self):
+        if not msgspec:
+            raise ImportError("msgspec is not installed")
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: str | bytes) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, data: Any) -> str:
+        return self._encoder.encode(data).decode()
+
+
+CODECS: dict[str, type[JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JsonCodec,
+}
+
+
+def get_codec(name: str | None = None) -> JsonCodec:
+    if name:
+        if not name in CODECS.keys():
+            raise ValueError(f"Unknown codec {name}")
+        return CODECS[name]()
+
+    for codec in CODECS.values():
+        try:
+            return codec()
+        except ImportError:
+            pass
+    return JsonCodec()
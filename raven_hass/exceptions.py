@@ -0,0 +1,18 @@
+class RavenHassError(RuntimeError):
+    pass
+
+
+class ListenerOverflowError(RavenHassError):
+    pass
+
+
+class AuthenticationError(RavenHassError):
+    pass
+
+
+class ConnectionLostError(RavenHassError):
+    retryable = True
+
+
+class CommandTimeoutError(RavenHassError, TimeoutError):
+    retryable = True
@@ -0,0 +1,178 @@
+from asyncio import Semaphore, Task, create_task, gather, sleep, wait_for
+from datetime import UTC, datetime
+from random import uniform
+from typing import Any, AsyncGenerator, Type
+from httpx import Limits
+from pydantic import BaseModel, ConfigDict
+from .base import BaseApi
+from .listener import Listener, OverflowPolicy
+from .models import WSEvent
+from .transport import rest_transport
+
+
+class FleetEvent(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    site: str
+    event: WSEvent | None = None
+    # Set instead of event when the site's subscription failed and was dropped
+    error: Exception | None = None
+
+
+class RavenHassFleet:
+    def __init__(
+        self,
+        client_class: Type[BaseApi] = BaseApi,
+        connect_concurrency: int = 8,
+        connect_jitter: float = 0.5,
+        connect_timeout: float | None = 30,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 40,
+        keepalive_expiry: float = 30,
+        http2: bool | None = None,
+        **client_options,
+    ):
+        self.client_class = client_class
+        self.client_options = client_options
+        self.connect_concurrency = connect_concurrency
+        self.connect_jitter = connect_jitter
+        self.connect_timeout = connect_timeout
+        self.transport = rest_transport(
+            Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2,
+        )
+        self.sites: dict[str, BaseApi] = {}
+        self.connected: set[str] = set()
+        self.errors: dict[str, Exception] = {}
+        self.lag: dict[str, float] = {}
+        self._handshakes = Semaphore(connect_concurrency)
+
+    def __getitem__(self, site: str) -> BaseApi:
+        return self.sites[site]
+
+    def __contains__(self, site: str) -> bool:
+        return site in self.sites
+
+    def add_site(self, site: str, host: str, token: str, **options) -> BaseApi:
+        if site in self.sites:
+            raise ValueError(f"Site {site} is already registered")
+
+        client = self.client_class(
+            host,
+            token,
+            transport=self.transport,
+            **{**self.client_options, **options},
+        )
+        self.sites[site] = client
+        return client
+
+    async def connect(self, site: str) -> bool:
+        client = self.sites[site]
+        # Spread handshakes out so a restart doesn't hit every site at once
+        await sleep(uniform(0, self.connect_jitter))
+        async with self._handshakes:
+            try:
+                await wait_for(client.__aenter__(), self.connect_timeout)
+            except Exception as e:
+                self.errors[site] = e
+                await client.__aexit__(None, None, None)
+                return False
+
+        self.errors.pop(site, None)
+        self.connected.add(site)
+        return True
+
+    async def disconnect(self, site: str):
+        if site in self.connected:
+            self.connected.discard(site)
+            await self.sites[site].__aexit__(None, None, None)
+
+    async def remove_site(self, site: str):
+        await self.disconnect(site)
+        self.sites.pop(site, None)
+        self.errors.pop(site, None)
+        self.lag.pop(site, None)
+
+    async def __aenter__(self):
+        await gather(*[self.connect(site) for site in self.sites.keys()])
+        return self
+
+    async def __aexit__(self, *args, **kwargs):
+        await gather(*[self.disconnect(site) for site in list(self.connected)])
+        await self.transport.aclose()
+
+    async def events(
+        self,
+        event: str | None = None,
+        sites: list[str] | None = None,
+        maxsize: int | None = None,
+        overflow: OverflowPolicy | None = None,
+        **kwargs,
+    ) -> AsyncGenerator[FleetEvent, Any]:
+        merged: Listener[FleetEvent] = Listener(
+            [("fleet", None)],
+            maxsize=(
+                self.client_options.get("listener_maxsize", 0)
+                if maxsize == None
+                else maxsize
+            ),
+            overflow=(
+                self.client_options.get("listener_overflow", OverflowPolicy.BLOCK)
+                if overflow == None
+                else overflow
+            ),
+        )
+
+        async def forward(site: str):
+            try:
+                async for message in self.sites[site].subscribe_events(
+                    event, maxsize=maxsize, overflow=overflow, **kwargs
+                ):
+                    fired = message.event.get("time_fired")
+                    if fired:
+                        self.lag[site] = (
+                            datetime.now(UTC) - datetime.fromisoformat(fired)
+                        ).total_seconds()
+                    item = FleetEvent(site=site, event=message)
+                    if not merged.offer(item):
+                        await merged.put(item)
+            except Exception as e:
+                self.errors[site] = e
+                # Never dropped by the overflow policy so the consumer always sees it
+                await merged.put(FleetEvent(site=site, error=e))
+
+        tasks: list[Task] = [
+            create_task(forward(site))
+            for site in (sites if sites != None else list(self.connected))
+            if site in self.connected
+        ]
+        try:
+            async for item in merged:
+                yield item
+        finally:
+            merged.close()
+            for task in tasks:
+                task.cancel()
+
+    def health(self) -> dict[str, dict[str, Any]]:
+        results = {}
+        for site, client in self.sites.items():
+            results[site] = {
+                "host": client.host,
+                "connected": client.ws_active.is_set(),
+                "hass_version": client.hass_version,
+                "connections": client.connection_count,
+                "pending_commands": len(client.pending_commands),
+                "rtt": client.latency.last,
+                "rtt_p95": client.latency.percentile(0.95),
+                "missed_pings": client.latency.missed,
+                "last_event": client.last_event_time,
+                "lag": self.lag.get(site),
+                "dropped": sum(listener.dropped for listener in client.listeners),
+                "error": repr(self.errors[site]) if site in self.errors else None,
+            }
+        return results
@@ -0,0 +1,211 @@
+from asyncio import Event, Queue
+from enum import StrEnum
+from typing import Any, Callable, Hashable
+from .exceptions import ListenerOverflowError
+
+
+class OverflowPolicy(StrEnum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    DISCONNECT = "disconnect"
+
+
+class Listener[T]:
+    def __init__(
+        self,
+        keys: list[tuple[str, int | None]],
+        maxsize: int = 0,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+    ):
+        self.keys = keys
+        self.queue: Queue[T] = Queue(maxsize)
+        self.overflow = overflow
+        self.dropped = 0
+        self.high_water = 0
+        self.error: Exception | None = None
+        self.closed = False
+        self.held: list[T] | None = None
+        self._space = Event()
+
+    @property
+    def maxsize(self) -> int:
+        return self.queue.maxsize
+
+    def __aiter__(self) -> "Listener[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        if self.error:
+            raise self.error
+        item = await self.queue.get()
+        self._space.set()
+        if self.error:
+            raise self.error
+        return item
+
+    def _push(self, item: T):
+        self.queue.put_nowait(item)
+        self.high_water = max(self.high_water, self.queue.qsize())
+
+    # Returns False when the item was not queued and the caller must await put()
+    def offer(self, item: T) -> bool:
+        if self.closed or self.error:
+            return True
+        if self.held != None:
+            self._hold(item)
+            return True
+        if not self.queue.full():
+            self._push(item)
+            return True
+
+        match self.overflow:
+            case OverflowPolicy.BLOCK:
+                return False
+            case OverflowPolicy.DROP_OLDEST:
+                self.queue.get_nowait()
+                self._push(item)
+            case OverflowPolicy.DROP_NEWEST:
+                pass
+            case OverflowPolicy.DISCONNECT:
+                self.fail(
+                    ListenerOverflowError(
+                        f"Listener for {self.keys} exceeded {self.maxsize} queued messages"
+                    )
+                )
+        self.dropped += 1
+        return True
+
+    async def put(self, item: T):
+        while self.queue.full() and not self.closed:
+            self._space.clear()
+            await self._space.wait()
+        if not self.closed:
+            self._push(item)
+
+    def _hold(self, item: T):
+        if self.maxsize <= 0 or len(self.held) < self.maxsize:
+            self.held.append(item)
+            return
+
+        # Blocking here would stall the reader that delivers the backfill, so
+        # BLOCK sheds the oldest held items; the backfill covers them anyway
+        match self.overflow:
+            case OverflowPolicy.BLOCK | OverflowPolicy.DROP_OLDEST:
+                self.held.pop(0)
+                self.held.append(item)
+            case OverflowPolicy.DROP_NEWEST:
+                pass
+            case OverflowPolicy.DISCONNECT:
+                self.fail(
+                    ListenerOverflowError(
+                        f"Listener for {self.keys} held more than {self.maxsize} messages"
+                    )
+                )
+        self.dropped += 1
+
+    def hold(self):
+        if self.held == None:
+            self.held = []
+
+    async def release(
+        self, items: list[T] | None = None, keep: Callable[[T], bool] | None = None
+    ):
+        held, self.held = self.held or [], None
+        if keep:
+            held = [item for item in held if keep(item)]
+        for item in [*(items or []), *held]:
+            if not self.offer(item):
+                await self.put(item)
+
+    def fail(self, error: Exception):
+        self.error = error
+        # Wake a consumer blocked on an empty queue so it sees the error
+        if self.queue.empty():
+            self.queue.put_nowait(None)
+
+    def close(self):
+        self.closed = True
+        self._space.set()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "keys": self.keys,
+            "size": self.queue.qsize(),
+            "maxsize": self.maxsize,
+            "overflow": self.overflow,
+            "dropped": self.dropped,
+            "high_water": self.high_water,
+            "disconnected": self.error != None,
+        }
+
+
+class ConflatingListener[T](Listener[T]):
+    def __init__(
+        self,
+        keys: list[tuple[str, int | None]],
+        key: Callable[[T], Hashable | None],
+        merge: Callable[[T, T], T] | None = None,
+    ):
+        super().__init__(keys)
+        self.key = key
+        self.merge = merge
+        self.pending: dict[Hashable, T] = {}
+        self.conflated = 0
+        self._ready = Event()
+
+    async def __anext__(self) -> T:
+        while len(self.pending) == 0 and not self.error:
+            self._ready.clear()
+            await self._ready.wait()
+        if self.error:
+            raise self.error
+        return self.pending.pop(next(iter(self.pending)))
+
+    def fail(self, error: Exception):
+        self.error = error
+        self._ready.set()
+
+    def offer(self, item: T) -> bool:
+        if self.closed:
+            return True
+        if self.held != None:
+            self._hold(item)
+            return True
+
+        key = self.key(item)
+        if key == None:
+            key = object()
+
+        if key in self.pending:
+            previous = self.pending[key]
+            self.pending[key] = self.merge(previous, item) if self.merge else item
+            self.conflated += 1
+        else:
+            self.pending[key] = item
+            self.high_water = max(self.high_water, len(self.pending))
+        self._ready.set()
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **super().stats(),
+            "size": len(self.pending),
+            "conflated": self.conflated,
+        }
+
+
+class Subscription:
+    def __init__(
+        self,
+        id: int,
+        command: str,
+        kwargs: dict[str, Any],
+        listener: Listener,
+        resync: bool = False,
+    ):
+        self.id = id
+        self.command = command
+        self.kwargs = kwargs
+        self.listener = listener
+        self.resync = resync
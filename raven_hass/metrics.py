@@ -0,0 +1,52 @@
+from collections import deque
+from statistics import mean
+
+
+class LatencyHistogram:
+    BUCKETS: tuple[float, ...] = (
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+
+    def __init__(self, window: int = 100):
+        self.samples: deque[float] = deque(maxlen=window)
+        self.missed = 0
+
+    def record(self, rtt: float):
+        self.samples.append(rtt)
+
+    def record_missed(self):
+        self.missed += 1
+
+    @property
+    def last(self) -> float | None:
+        return self.samples[-1] if len(self.samples) > 0 else None
+
+    @property
+    def mean(self) -> float | None:
+        return mean(self.samples) if len(self.samples) > 0 else None
+
+    def percentile(self, q: float) -> float | None:
+        if len(self.samples) == 0:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def histogram(self) -> dict[float, int]:
+        counts = {bucket: 0 for bucket in self.BUCKETS}
+        counts[float("inf")] = 0
+        for sample in self.samples:
+            for bucket in counts.keys():
+                if sample <= bucket:
+                    counts[bucket] += 1
+                    break
+        return counts
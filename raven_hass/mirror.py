@@ -0,0 +1,233 @@
+from asyncio import (
+    CancelledError,
+    Event,
+    Queue,
+    Task,
+    create_task,
+    wait,
+    FIRST_COMPLETED,
+)
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Literal
+from pydantic import BaseModel, ValidationError
+from .models import HAEntity, CompressedState, EntityStreamEvent
+
+if TYPE_CHECKING:
+    from .base import BaseApi
+
+
+class EntityChange(BaseModel):
+    entity_id: str
+    kind: Literal["added", "changed", "removed"]
+    old: HAEntity | None = None
+    new: HAEntity | None = None
+
+
+class EntityMirror:
+    def __init__(self, client: "BaseApi", entity_ids: list[str] | None = None):
+        self.client = client
+        self.entity_ids = entity_ids
+        self.entities: dict[str, HAEntity] = {}
+        self.states: dict[str, dict[str, Any]] = {}
+        self.updated_at: dict[str, datetime] = {}
+        self.invalid: dict[str, Exception] = {}
+        self.synced_at: datetime | None = None
+        self.ready = Event()
+        self.task: Task | None = None
+        self._listeners: set[Queue] = set()
+
+    async def __aenter__(self):
+        self.start()
+        await self.wait_ready()
+        return self
+
+    async def __aexit__(self, *args, **kwargs):
+        await self.stop()
+
+    def __aiter__(self) -> AsyncGenerator[EntityChange, Any]:
+        return self.changes()
+
+    def __getitem__(self, entity_id: str) -> HAEntity:
+        return self.entities[entity_id]
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self.entities
+
+    def get(self, entity_id: str) -> HAEntity | None:
+        return self.entities.get(entity_id)
+
+    @property
+    def stale(self) -> bool:
+        return not self.ready.is_set() or not self.client.ws_active.is_set()
+
+    def start(self):
+        if not self.task:
+            self.task = create_task(self.run())
+
+    async def wait_ready(self):
+        ready = create_task(self.ready.wait())
+        done, _ = await wait([ready, self.task], return_when=FIRST_COMPLETED)
+        if ready not in done:
+            ready.cancel()
+            self.task.result()
+
+    async def refresh(self):
+        await self.stop()
+        self.start()
+        await self.wait_ready()
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except CancelledError:
+                pass
+            self.task = None
+        self.ready.clear()
+
+    async def run(self):
+        async for event in self.client.subscribe(
+            "subscribe_entities", _resync=True, entity_ids=self.entity_ids
+        ):
+            # After a reconnect the replayed subscription starts with a new snapshot
+            if event.type == "resubscribed":
+                self.ready.clear()
+                continue
+
+            parsed = EntityStreamEvent.model_validate(event.event)
+            if self.ready.is_set():
+                self.apply(parsed)
+            else:
+                self.apply(parsed, snapshot=True)
+                self.synced_at = datetime.now(UTC)
+                self.ready.set()
+
+    async def changes(self) -> AsyncGenerator[EntityChange, Any]:
+        queue = Queue()
+        self._listeners.add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._listeners.discard(queue)
+
+    def apply(
+        self, event: EntityStreamEvent, snapshot: bool = False
+    ) -> list[EntityChange]:
+        changes: list[EntityChange] = []
+        removed = event.removed
+        if snapshot:
+            removed = removed + [i for i in self.states if not i in event.added]
+
+        for entity_id, state in event.added.items():
+            expanded = self._expand(entity_id, state)
+            if snapshot and self.states.get(entity_id) == expanded:
+                continue
+            self.states[entity_id] = expanded
+            change = self._update(entity_id)
+            if change:
+                changes.append(change)
+
+        for entity_id, diff in event.changed.items():
+            current = self.states.get(entity_id)
+            if current == None:
+                continue
+
+            if diff.additions:
+                additions = diff.additions
+                fields = additions.model_fields_set
+                if "state" in fields:
+                    current["state"] = additions.state
+                if "attributes" in fields:
+                    current["attributes"] = {
+                        **current["attributes"],
+                        **additions.attributes,
+                    }
+                if "context" in fields:
+                    current["context"] = self._context(additions.context)
+                if additions.last_changed != None:
+                    current["last_changed"] = current["last_updated"] = (
+                        datetime.fromtimestamp(additions.last_changed, UTC)
+                    )
+                elif additions.last_updated != None:
+                    current["last_updated"] = datetime.fromtimestamp(
+                        additions.last_updated, UTC
+                    )
+
+            if diff.removals:
+                current["attributes"] = {
+                    key: value
+                    for key, value in current["attributes"].items()
+                    if not key in diff.removals.attributes
+                }
+
+            change = self._update(entity_id)
+            if change:
+                changes.append(change)
+
+        for entity_id in removed:
+            self.states.pop(entity_id, None)
+            self.updated_at.pop(entity_id, None)
+            self.invalid.pop(entity_id, None)
+            old = self.entities.pop(entity_id, None)
+            if old:
+                changes.append(
+                    EntityChange(entity_id=entity_id, kind="removed", old=old)
+                )
+
+        for change in changes:
+            for queue in self._listeners:
+                queue.put_nowait(change)
+        return changes
+
+    def _update(self, entity_id: str) -> EntityChange | None:
+        old = self.entities.get(entity_id)
+        error: Exception | None = None
+        try:
+            new = HAEntity.resolve_entity(
+                self.states[entity_id],
+                lazy=self.client.lazy_entities,
+                client=self.client,
+            )
+            if new == None:
+                error = ValueError(f"State of {entity_id} could not be resolved")
+        except ValidationError as e:
+            error = e
+
+        if error:
+            # Keep the raw state so later diffs still apply, but don't serve a
+            # typed entity that no longer matches it
+            self.invalid[entity_id] = error
+            self.entities.pop(entity_id, None)
+            self.updated_at[entity_id] = datetime.now(UTC)
+            if old:
+                return EntityChange(entity_id=entity_id, kind="removed", old=old)
+            return None
+
+        self.invalid.pop(entity_id, None)
+        self.entities[entity_id] = new
+        self.updated_at[entity_id] = datetime.now(UTC)
+        return EntityChange(
+            entity_id=entity_id, kind="changed" if old else "added", old=old, new=new
+        )
+
+    def _context(self, context: str | dict[str, Any] | None) -> dict[str, Any]:
+        if isinstance(context, dict):
+            return context
+        return {"id": context or ""}
+
+    def _expand(self, entity_id: str, state: CompressedState) -> dict[str, Any]:
+        last_changed = datetime.fromtimestamp(state.last_changed or 0, UTC)
+        return {
+            "entity_id": entity_id,
+            "state": state.state,
+            "attributes": dict(state.attributes),
+            "context": self._context(state.context),
+            "last_changed": last_changed,
+            "last_updated": (
+                datetime.fromtimestamp(state.last_updated, UTC)
+                if state.last_updated != None
+                else last_changed
+            ),
+        }
@@ -1,5 +1,28 @@
+from typing import Any
+from . import entities, service, ws_messages
 from .ws_messages import *
-from .entities import *
 from .entities import REGISTRY as ENTITY_MODELS
 from .service import *
 from .service import REGISTRY as SERVICE_MODELS
+
+# Entity names resolve through __getattr__, so only a star import pays for
+# loading every platform module
+__all__ = list(
+    dict.fromkeys(
+        [
+            *entities.__all__,
+            *(
+                name
+                for module in (ws_messages, service)
+                for name in vars(module)
+                if not name.startswith("_")
+            ),
+            "ENTITY_MODELS",
+            "SERVICE_MODELS",
+        ]
+    )
+)
+
+
+def __getattr__(name: str) -> Any:
+    return getattr(entities, name)
@@ -0,0 +1,261 @@
+from importlib import import_module
+from typing import Any
+from .base import (
+    REGISTRY,
+    BaseAttributes,
+    BinaryState,
+    EntityCategory,
+    HAContext,
+    HAEntity,
+    Platform,
+    UnitOfTemperature,
+)
+
+# Platform modules are only imported the first time one of their domains is
+# resolved or one of their names is accessed
+PLATFORMS: dict[str, tuple[str, ...]] = {
+    "alarm_control_panel": (
+        "AlarmControlPanelStates",
+        "AlarmControlPanelCodeFormat",
+        "AlarmControlPanelEntityFeature",
+        "AlarmControlPanelAttributes",
+        "AlarmControlPanelEntity",
+    ),
+    "binary_sensor": (
+        "BinarySensorDeviceClass",
+        "BinarySensorAttributes",
+        "BinarySensorEntity",
+    ),
+    "button": (
+        "ButtonDeviceClass",
+        "ButtonAttributes",
+        "ButtonEntity",
+    ),
+    "calendar": (
+        "CalendarEvent",
+        "CalendarEntityFeature",
+        "CalendarAttributes",
+        "CalendarEntity",
+    ),
+    "camera": (
+        "CameraEntityFeature",
+        "CameraStreamType",
+        "CameraAttributes",
+        "CameraEntity",
+    ),
+    "climate": (
+        "HVACMode",
+        "HVACAction",
+        "ClimateEntityFeature",
+        "ClimateAttributes",
+        "ClimateEntity",
+    ),
+    "conversation": (
+        "ConversationAttributes",
+        "ConversationEntity",
+    ),
+    "cover": (
+        "CoverDeviceClass",
+        "CoverEntityFeature",
+        "CoverAttributes",
+        "CoverEntity",
+    ),
+    "date": (
+        "DateAttributes",
+        "DateEntity",
+    ),
+    "datetime": (
+        "DateTimeAttributes",
+        "DateTimeEntity",
+    ),
+    "device_tracker": (
+        "SourceType",
+        "ScannerAttributes",
+        "TrackerAttributes",
+        "DeviceTrackerEntity",
+    ),
+    "event": (
+        "EventDeviceClass",
+        "EventAttributes",
+        "EventEntity",
+    ),
+    "fan": (
+        "FanEntityFeature",
+        "FanAttributes",
+        "FanEntity",
+    ),
+    "humidifier": (
+        "HumidifierDeviceClass",
+        "HumidifierAction",
+        "HumidifierEntityFeature",
+        "HumidifierAttributes",
+        "HumidifierEntity",
+    ),
+    "image": (
+        "ImageAttributes",
+        "ImageEntity",
+    ),
+    "lawn_mower": (
+        "LawnMowerActivity",
+        "LawnMowerEntityFeature",
+        "LawnMowerAttributes",
+        "LawnMowerEntity",
+    ),
+    "light": (
+        "LightEntityFeature",
+        "ColorMode",
+        "LightAttributes",
+        "LightEntity",
+    ),
+    "lock": (
+        "LockFeatures",
+        "LockAttributes",
+        "LockEntity",
+    ),
+    "media_player": (
+        "MediaPlayerState",
+        "MediaClass",
+        "MediaType",
+        "RepeatMode",
+        "MediaPlayerEntityFeature",
+        "MediaPlayerDeviceClass",
+        "MediaPlayerAttributes",
+        "MediaPlayerEntity",
+    ),
+    "notify": ("NotifyEntity",),
+    "number": (
+        "NumberMode",
+        "NumericalDeviceClass",
+        "NumberAttributes",
+        "NumberEntity",
+    ),
+    "remote": (
+        "RemoteEntityFeature",
+        "RemoteAttributes",
+        "RemoteEntity",
+    ),
+    "scene": ("SceneEntity",),
+    "select": (
+        "SelectAttributes",
+        "SelectEntity",
+    ),
+    "sensor": (
+        "SensorStateClass",
+        "SensorAttributes",
+        "SensorEntity",
+    ),
+    "siren": (
+        "SirenEntityFeature",
+        "SirenAttributes",
+        "SirenEntity",
+    ),
+    "stt": (
+        "AudioCodecs",
+        "AudioFormats",
+        "AudioBitRates",
+        "AudioSampleRates",
+        "AudioChannels",
+        "SpeechResultState",
+        "STTAttributes",
+        "STTEntity",
+    ),
+    "switch": (
+        "SwitchDeviceClass",
+        "SwitchAttributes",
+        "SwitchEntity",
+    ),
+    "text": (
+        "TextMode",
+        "TextAttributes",
+        "TextEntity",
+    ),
+    "time": (
+        "TimeAttributes",
+        "TimeEntity",
+    ),
+    "todo": (
+        "TodoListEntityFeature",
+        "TodoItemStatus",
+        "TodoListItem",
+        "TodoListAttributes",
+        "TodoListEntity",
+    ),
+    "tts": (
+        "TTSAttributes",
+        "TTSEntity",
+    ),
+    "update": (
+        "UpdateEntityFeature",
+        "UpdateDeviceClass",
+        "UpdateAttributes",
+        "UpdateEntity",
+    ),
+    "vacuum": (
+        "VacuumEntityFeature",
+        "VacuumEntityState",
+        "VacuumAttributes",
+        "VacuumEntity",
+    ),
+    "valve": (
+        "ValveDeviceClass",
+        "ValveEntityFeature",
+        "ValveState",
+        "ValveAttributes",
+        "ValveEntity",
+    ),
+    "wake_word": (
+        "WakeWord",
+        "WakeWordAttributes",
+        "WakeWordEntity",
+    ),
+    "water_heater": (
+        "WaterHeaterEntityFeature",
+        "WaterHeaterStates",
+        "WaterHeaterAttributes",
+        "WaterHeaterEntity",
+    ),
+    "weather": (
+        "WeatherEntityFeature",
+        "WeatherForecast",
+        "WeatherAttributes",
+        "WeatherEntity",
+    ),
+}
+
+ALIASES: dict[str, tuple[str, ...]] = {
+    "button": ("input_button",),
+    "datetime": ("input_datetime",),
+    "number": ("input_number",),
+    "select": ("input_select",),
+    "switch": ("input_boolean",),
+    "text": ("input_text",),
+}
+
+_EXPORTS = {name: module for module, names in PLATFORMS.items() for name in names}
+
+__all__ = [
+    "REGISTRY",
+    "BaseAttributes",
+    "BinaryState",
+    "EntityCategory",
+    "HAContext",
+    "HAEntity",
+    "Platform",
+    "UnitOfTemperature",
+    *_EXPORTS.keys(),
+]
+
+for _module in PLATFORMS.keys():
+    REGISTRY.defer(f"{__name__}.{_module}", _module, *ALIASES.get(_module, ()))
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals().keys(), *_EXPORTS.keys()])
@@ -0,0 +1,43 @@
+from enum import IntFlag, StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class AlarmControlPanelStates(StrEnum):
+    DISARMED = "disarmed"
+    ARMED_HOME = "armed_home"
+    ARMED_AWAY = "armed_away"
+    ARMED_NIGHT = "armed_night"
+    ARMED_VACATION = "armed_vacation"
+    ARMED_CUSTOM = "armed_custom_bypass"
+    PENDING = "pending"
+    ARMING = "arming"
+    DISARMING = "disarming"
+    TRIGGERED = "triggered"
+
+
+class AlarmControlPanelCodeFormat(StrEnum):
+    TEXT = "text"
+    NUMBER = "number"
+
+
+class AlarmControlPanelEntityFeature(IntFlag):
+    ARM_HOME = 1
+    ARM_AWAY = 2
+    ARM_NIGHT = 4
+    TRIGGER = 8
+    ARM_CUSTOM_BYPASS = 16
+    ARM_VACATION = 32
+
+
+class AlarmControlPanelAttributes(BaseAttributes):
+    state: AlarmControlPanelStates | None
+    code_arm_required: bool = True
+    changed_by: str | None = None
+    supported_features: AlarmControlPanelEntityFeature | None = None
+
+
+@REGISTRY.register(Platform.ALARM_CONTROL_PANEL)
+class AlarmControlPanelEntity(HAEntity):
+    domain: Literal[Platform.ALARM_CONTROL_PANEL]
+    attributes: AlarmControlPanelAttributes
@@ -0,0 +1,315 @@
+from datetime import datetime
+from enum import StrEnum
+from typing import Annotated, Any, ClassVar, Iterable, Type
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    GetCoreSchemaHandler,
+    PrivateAttr,
+    TypeAdapter,
+    create_model,
+    model_validator,
+)
+from pydantic_core import CoreSchema, core_schema
+from ..util import Registry, RegisteredModel
+from ..service import Service
+from ..ws_messages import WSResult
+
+REGISTRY = Registry()
+
+
+class Platform(StrEnum):
+
+    AIR_QUALITY = "air_quality"
+    ALARM_CONTROL_PANEL = "alarm_control_panel"
+    BINARY_SENSOR = "binary_sensor"
+    BUTTON = "button"
+    CALENDAR = "calendar"
+    CAMERA = "camera"
+    CLIMATE = "climate"
+    CONVERSATION = "conversation"
+    COVER = "cover"
+    DATE = "date"
+    DATETIME = "datetime"
+    DEVICE_TRACKER = "device_tracker"
+    EVENT = "event"
+    FAN = "fan"
+    GEO_LOCATION = "geo_location"
+    HUMIDIFIER = "humidifier"
+    IMAGE = "image"
+    IMAGE_PROCESSING = "image_processing"
+    LAWN_MOWER = "lawn_mower"
+    LIGHT = "light"
+    LOCK = "lock"
+    MAILBOX = "mailbox"
+    MEDIA_PLAYER = "media_player"
+    NOTIFY = "notify"
+    NUMBER = "number"
+    REMOTE = "remote"
+    SCENE = "scene"
+    SELECT = "select"
+    SENSOR = "sensor"
+    SIREN = "siren"
+    STT = "stt"
+    SWITCH = "switch"
+    TEXT = "text"
+    TIME = "time"
+    TODO = "todo"
+    TTS = "tts"
+    VACUUM = "vacuum"
+    VALVE = "valve"
+    UPDATE = "update"
+    WAKE_WORD = "wake_word"
+    WATER_HEATER = "water_heater"
+    WEATHER = "weather"
+
+
+class UnitOfTemperature(StrEnum):
+    """Temperature units."""
+
+    CELSIUS = "°C"
+    FAHRENHEIT = "°F"
+    KELVIN = "K"
+
+
+class HAContext(BaseModel):
+    id: str
+    parent_id: str | None = None
+    user_id: str | None = None
+
+
+class EntityCategory(StrEnum):
+    CONFIG = "config"
+    DIAGNOSTIC = "diagnostic"
+
+
+class BinaryState(StrEnum):
+    STATE_ON = "on"
+    STATE_OFF = "off"
+
+
+class BaseAttributes(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    assumed_state: bool = False
+    attribution: str | None = None
+    available: bool = True
+    device_class: str | None = None
+    entity_picture: str | None = None
+    extra_state_attributes: dict | None = None
+    has_entity_name: bool = False
+    name: str | None = None
+    should_poll: bool = True
+    state: str | int | float | None = None
+    supported_features: int | None = None
+    translation_key: str | None = None
+    translation_placeholders: dict | None = None
+    device_info: dict | None = None
+    entity_category: EntityCategory | None = None
+    entity_registry_enabled_default: bool = True
+    entity_registry_visible_default: bool = True
+    unique_id: str | None = None
+    capability_attributes: dict | None = None
+    force_update: bool = False
+    icon: str | None = None
+    state_attributes: dict | None = None
+    unit_of_measurement: str | None = None
+    enabled: bool = True
+
+
+@REGISTRY.register("entity_base")
+class HAEntity(RegisteredModel):
+    entity_id: str
+    domain: str
+    name: str
+    state: str | int | float | bool | None
+    last_changed: datetime
+    last_updated: datetime
+    context: HAContext
+    attributes: BaseAttributes
+
+    _raw_attributes: dict | None = PrivateAttr(default=None)
+    _identity_models: ClassVar[dict[type, Type[BaseModel]]] = {}
+    _attribute_adapters: ClassVar[dict[type, TypeAdapter]] = {}
+    _list_adapters: ClassVar[dict[frozenset[str], TypeAdapter]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "attributes" and self._raw_attributes != None:
+            adapter = self._attribute_adapters.get(type(self))
+            if not adapter:
+                adapter = TypeAdapter(type(self).model_fields["attributes"].annotation)
+                self._attribute_adapters[type(self)] = adapter
+
+            attributes = adapter.validate_python(self._raw_attributes)
+            self.__dict__["attributes"] = attributes
+            self._raw_attributes = None
+            return attributes
+        return super().__getattr__(name)
+
+    def model_dump(self, **kwargs) -> dict[str, Any]:
+        self.attributes
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        self.attributes
+        return super().model_dump_json(**kwargs)
+
+    def is_domain(self, domain: str) -> bool:
+        return domain == self.domain
+
+    @model_validator(mode="before")
+    @classmethod
+    def expand_id(cls, data: Any) -> Any:
+        # Already expanded, e.g. by resolve_entities, so there is nothing to copy
+        if isinstance(data, dict) and "domain" in data and "name" in data:
+            return data
+
+        if isinstance(data, dict):
+            _data = data.copy()
+        elif isinstance(data, BaseModel):
+            _data = data.model_dump()
+        else:
+            raise ValueError("Invalid data type")
+
+        parts = data["entity_id"].split(".", maxsplit=1)
+        if len(parts) == 2:
+            _data["domain"] = parts[0]
+            _data["name"] = parts[1]
+
+        return _data
+
+    @classmethod
+    def construct_lazy(cls, data: dict, client: Any = None) -> "HAEntity":
+        identity = cls._identity_models.get(cls)
+        if not identity:
+            identity = create_model(
+                cls.__name__ + "Identity",
+                **{
+                    name: (field.annotation, field)
+                    for name, field in cls.model_fields.items()
+                    if name != "attributes"
+                },
+            )
+            cls._identity_models[cls] = identity
+
+        validated = identity.model_validate(cls.expand_id(data))
+        entity = cls.model_construct(
+            _fields_set=validated.model_fields_set | {"attributes"},
+            **dict(validated),
+        )
+        entity._raw_attributes = data.get("attributes", {})
+        return entity.bind(client)
+
+    @classmethod
+    def resolve_entity(
+        cls, data: dict, lazy: bool = False, client: Any = None
+    ) -> "HAEntity | None":
+        if "entity_id" in data.keys():
+            domain = data["entity_id"].split(".")[0]
+            constructor = REGISTRY[domain]
+            if constructor:
+                return (
+                    constructor.construct_lazy(data, client)
+                    if lazy
+                    else constructor.model_validate(data, context={"client": client})
+                )
+
+            try:
+                return (
+                    HAEntity.construct_lazy(data, client)
+                    if lazy
+                    else HAEntity.model_validate(data, context={"client": client})
+                )
+            except:
+                pass
+        return None
+
+    @classmethod
+    def entity_list_adapter(
+        cls, domains: Iterable[str] = ()
+    ) -> TypeAdapter[list["HAEntity | None"]]:
+        # Unregistered domains get their own tag for the base model, so every
+        # item is dispatched on its plain domain string
+        choices = {
+            **{domain: HAEntity for domain in domains},
+            **REGISTRY.registry,
+        }
+        keys = frozenset(choices.keys())
+        adapter = cls._list_adapters.get(keys)
+        if not adapter:
+            adapter = TypeAdapter(
+                list[Annotated[HAEntity | None, _EntityUnion(choices)]]
+            )
+            cls._list_adapters[keys] = adapter
+        return adapter
+
+    @classmethod
+    def resolve_entities(
+        cls, data: list[dict], lazy: bool = False, client: Any = None
+    ) -> list["HAEntity | None"]:
+        if lazy:
+            return [
+                cls.resolve_entity(entity, lazy=True, client=client) for entity in data
+            ]
+
+        # Expands ids in place, so `data` must not be shared with anything else
+        domains = set()
+        for entity in data:
+            parts = entity.get("entity_id", "").split(".", maxsplit=1)
+            if len(parts) == 2:
+                entity["domain"], entity["name"] = parts
+                domains.add(parts[0])
+        for domain in domains:
+            REGISTRY[domain]
+
+        entities = cls.entity_list_adapter(domains).validate_python(
+            data, context={"client": client}
+        )
+        # Only the items that failed are retried, to surface their errors
+        return [
+            (
+                entity
+                if entity != None
+                else cls.resolve_entity(data[index], client=client)
+            )
+            for index, entity in enumerate(entities)
+        ]
+
+    async def call_service(
+        self, service: Service | str, data: dict | None = None
+    ) -> WSResult:
+        if isinstance(service, Service):
+            domain = service.domain
+            svc = service.service
+        else:
+            domain, svc = service.split(".", maxsplit=1)
+
+        return await self.client.send_ws_command(
+            "call_service",
+            domain=domain,
+            service=svc,
+            service_data=data,
+            target={"entity_id": self.entity_id},
+        )
+
+
+class _EntityUnion:
+    # A tagged union keyed on the "domain" key with failed items validating to
+    # None, so dispatch and error handling both stay inside pydantic-core
+    def __init__(self, choices: dict[str, Type["HAEntity"]]):
+        self.choices = choices
+
+    def __get_pydantic_core_schema__(
+        self, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return core_schema.with_default_schema(
+            core_schema.tagged_union_schema(
+                {
+                    key: handler.generate_schema(model)
+                    for key, model in self.choices.items()
+                },
+                discriminator="domain",
+            ),
+            default=None,
+            on_error="default",
+        )
@@ -0,0 +1,45 @@
+from enum import StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class BinarySensorDeviceClass(StrEnum):
+    BATTERY = "battery"
+    BATTERY_CHARGING = "battery_charging"
+    CO = "carbon_monoxide"
+    COLD = "cold"
+    CONNECTIVITY = "connectivity"
+    DOOR = "door"
+    GARAGE_DOOR = "garage_door"
+    GAS = "gas"
+    HEAT = "heat"
+    LIGHT = "light"
+    LOCK = "lock"
+    MOISTURE = "moisture"
+    MOTION = "motion"
+    MOVING = "moving"
+    OCCUPANCY = "occupancy"
+    OPENING = "opening"
+    PLUG = "plug"
+    POWER = "power"
+    PRESENCE = "presence"
+    PROBLEM = "problem"
+    RUNNING = "running"
+    SAFETY = "safety"
+    SMOKE = "smoke"
+    SOUND = "sound"
+    TAMPER = "tamper"
+    UPDATE = "update"
+    VIBRATION = "vibration"
+    WINDOW = "window"
+
+
+class BinarySensorAttributes(BaseAttributes):
+    is_on: bool | None = None
+    device_class: BinarySensorDeviceClass | None = None
+
+
+@REGISTRY.register(Platform.BINARY_SENSOR)
+class BinarySensorEntity(HAEntity):
+    domain: Literal[Platform.BINARY_SENSOR]
+    attributes: BinarySensorAttributes
@@ -0,0 +1,22 @@
+from enum import StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class ButtonDeviceClass(StrEnum):
+    IDENTIFY = "identify"
+    RESTART = "restart"
+    UPDATE = "update"
+
+
+class ButtonAttributes(BaseAttributes):
+    device_class: ButtonDeviceClass | None = None
+
+
+@REGISTRY.register(Platform.BUTTON, "input_button")
+class ButtonEntity(HAEntity):
+    domain: Literal[Platform.BUTTON]
+    attributes: ButtonAttributes
+
+    def is_domain(self, domain: str) -> bool:
+        return domain in [Platform.BUTTON, "input_button"]
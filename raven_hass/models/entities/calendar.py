@@ -0,0 +1,34 @@
+from datetime import date, datetime
+from enum import IntFlag
+from typing import Literal
+from pydantic import BaseModel
+from .base import REGISTRY, BaseAttributes, BinaryState, HAEntity, Platform
+
+
+class CalendarEvent(BaseModel):
+    start: datetime | date
+    end: datetime | date
+    summary: str
+    location: str | None = None
+    description: str | None = None
+    uid: str | None = None
+    recurrence_id: str | None = None
+    rrule: str | None = None
+
+
+class CalendarEntityFeature(IntFlag):
+    CREATE_EVENT = 1
+    DELETE_EVENT = 2
+    UPDATE_EVENT = 4
+
+
+class CalendarAttributes(BaseAttributes):
+    supported_features: CalendarEntityFeature | None = None
+    event: CalendarEvent | None = None
+
+
+@REGISTRY.register(Platform.CALENDAR)
+class CalendarEntity(HAEntity):
+    domain: Literal[Platform.CALENDAR]
+    state: BinaryState | None
+    attributes: CalendarAttributes
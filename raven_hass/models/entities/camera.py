@@ -0,0 +1,32 @@
+from enum import IntFlag, StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class CameraEntityFeature(IntFlag):
+    ON_OFF = 1
+    STREAM = 2
+
+
+class CameraStreamType(StrEnum):
+    HLS = "hls"
+    WEB_RTC = "web_rtc"
+
+
+class CameraAttributes(BaseAttributes):
+    supported_features: CameraEntityFeature | None = None
+    brand: str | None = None
+    frame_interval: float = 0.5
+    frontend_stream_type: CameraStreamType | None = None
+    is_on: bool = True
+    is_recording: bool = False
+    is_streaming: bool = False
+    model: str | None = None
+    motion_detection_enabled: bool = False
+    use_stream_for_stills: bool = False
+
+
+@REGISTRY.register(Platform.CAMERA)
+class CameraEntity(HAEntity):
+    domain: Literal[Platform.CAMERA]
+    attributes: CameraAttributes
@@ -0,0 +1,67 @@
+from enum import IntFlag, StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform, UnitOfTemperature
+
+
+class HVACMode(StrEnum):
+    OFF = "off"
+    HEAT = "heat"
+    COOL = "cool"
+    HEAT_COOL = "heat_cool"
+    AUTO = "auto"
+    DRY = "dry"
+    FAN_ONLY = "fan_only"
+
+
+class HVACAction(StrEnum):
+    COOLING = "cooling"
+    DRYING = "drying"
+    FAN = "fan"
+    HEATING = "heating"
+    IDLE = "idle"
+    OFF = "off"
+    PREHEATING = "preheating"
+
+
+class ClimateEntityFeature(IntFlag):
+    TARGET_TEMPERATURE = 1
+    TARGET_TEMPERATURE_RANGE = 2
+    TARGET_HUMIDITY = 4
+    FAN_MODE = 8
+    PRESET_MODE = 16
+    SWING_MODE = 32
+    AUX_HEAT = 64
+    TURN_OFF = 128
+    TURN_ON = 256
+
+
+class ClimateAttributes(BaseAttributes):
+    current_humidity: float | None = None
+    current_temperature: float | None = None
+    fan_mode: str | None = None
+    fan_modes: list[str] | None = None
+    hvac_action: HVACAction | None = None
+    hvac_mode: HVACMode | None = None
+    hvac_modes: list[HVACMode] = []
+    max_humidity: float = 99
+    max_temp: float = 35
+    min_humidity: float = 30
+    min_temp: float = 7
+    precision: float = 1
+    preset_mode: str | None = None
+    preset_modes: list[str] | None = None
+    swing_mode: str | None = None
+    swing_modes: list[str] | None = None
+    target_humidity: float | None = None
+    target_temperature: float | None = None
+    target_temperature_high: float | None = None
+    target_temperature_low: float | None = None
+    target_temperature_step: float | None = None
+    temperature_unit: UnitOfTemperature | str = UnitOfTemperature.CELSIUS
+    supported_features: ClimateEntityFeature | None = None
+
+
+@REGISTRY.register(Platform.CLIMATE)
+class ClimateEntity(HAEntity):
+    domain: Literal[Platform.CLIMATE]
+    attributes: ClimateAttributes
@@ -0,0 +1,12 @@
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class ConversationAttributes(BaseAttributes):
+    supported_languages: list[str] | Literal["*"]
+
+
+@REGISTRY.register(Platform.CONVERSATION)
+class ConversationEntity(HAEntity):
+    domain: Literal[Platform.CONVERSATION]
+    attributes: ConversationAttributes
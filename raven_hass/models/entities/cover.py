@@ -0,0 +1,43 @@
+from enum import IntFlag, StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class CoverDeviceClass(StrEnum):
+    AWNING = "awning"
+    BLIND = "blind"
+    CURTAIN = "curtain"
+    DAMPER = "damper"
+    DOOR = "door"
+    GARAGE = "garage"
+    GATE = "gate"
+    SHADE = "shade"
+    SHUTTER = "shutter"
+    WINDOW = "window"
+
+
+class CoverEntityFeature(IntFlag):
+    OPEN = 1
+    CLOSE = 2
+    SET_POSITION = 4
+    STOP = 8
+    OPEN_TILT = 16
+    CLOSE_TILT = 32
+    STOP_TILT = 64
+    SET_TILT_POSITION = 128
+
+
+class CoverAttributes(BaseAttributes):
+    current_cover_position: int | None = None
+    current_cover_tilt_position: int | None = None
+    is_closed: bool | None = None
+    is_closing: bool | None = None
+    is_opening: bool | None = None
+    device_class: CoverDeviceClass | None = None
+    supported_features: CoverEntityFeature | None = None
+
+
+@REGISTRY.register(Platform.COVER)
+class CoverEntity(HAEntity):
+    domain: Literal[Platform.COVER]
+    attributes: CoverAttributes
@@ -0,0 +1,13 @@
+from datetime import date
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class DateAttributes(BaseAttributes):
+    native_value: date | None = None
+
+
+@REGISTRY.register(Platform.DATE)
+class DateEntity(HAEntity):
+    domain: Literal[Platform.DATE]
+    attributes: DateAttributes
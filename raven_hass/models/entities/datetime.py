@@ -0,0 +1,17 @@
+from datetime import datetime
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+from .date import DateAttributes
+
+
+class DateTimeAttributes(BaseAttributes):
+    native_value: datetime | None = None
+
+
+@REGISTRY.register(Platform.DATETIME, "input_datetime")
+class DateTimeEntity(HAEntity):
+    domain: Literal[Platform.DATETIME]
+    attributes: DateAttributes
+
+    def is_domain(self, domain: str) -> bool:
+        return domain in [Platform.DATETIME, "input_datetime"]
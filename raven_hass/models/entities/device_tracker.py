@@ -0,0 +1,42 @@
+from enum import StrEnum
+from typing import Literal
+from pydantic import computed_field
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class SourceType(StrEnum):
+    GPS = "gps"
+    ROUTER = "router"
+    BLUETOOTH = "bluetooth"
+    BLUETOOTH_LE = "bluetooth_le"
+
+
+class ScannerAttributes(BaseAttributes):
+    battery_level: int | None = None
+    hostname: str | None = None
+    ip_address: str | None = None
+    is_connected: bool = False
+    mac_address: str | None = None
+    source_type: SourceType | None = None
+
+
+class TrackerAttributes(BaseAttributes):
+    battery_level: int | None = None
+    latitude: float | None = None
+    location_accuracy: int = 0
+    location_name: str | None = None
+    longitude: float | None = None
+    source_type: SourceType | None = None
+
+
+@REGISTRY.register(Platform.DEVICE_TRACKER)
+class DeviceTrackerEntity(HAEntity):
+    domain: Literal[Platform.DEVICE_TRACKER]
+    attributes: ScannerAttributes | TrackerAttributes
+
+    @computed_field
+    @property
+    def tracker_type(self) -> Literal["scanner", "tracker"]:
+        return (
+            "scanner" if isinstance(self.attributes, ScannerAttributes) else "tracker"
+        )
@@ -0,0 +1,20 @@
+from enum import StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class EventDeviceClass(StrEnum):
+    BUTTON = "button"
+    DOORBELL = "doorbell"
+    MOTION = "motion"
+
+
+class EventAttributes(BaseAttributes):
+    event_types: list[str] = []
+    device_class: EventDeviceClass | None = None
+
+
+@REGISTRY.register(Platform.EVENT)
+class EventEntity(HAEntity):
+    domain: Literal[Platform.EVENT]
+    attributes: EventAttributes
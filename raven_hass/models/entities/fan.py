@@ -0,0 +1,27 @@
+from enum import IntFlag
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class FanEntityFeature(IntFlag):
+    SET_SPEED = 1
+    OSCILLATE = 2
+    DIRECTION = 4
+    PRESET_MODE = 8
+
+
+class FanAttributes(BaseAttributes):
+    current_direction: str | None = None
+    is_on: bool | None = None
+    oscillating: bool | None = None
+    percentage: int | None = 0
+    preset_mode: str | None = None
+    preset_modes: list[str] | None = None
+    speed_count: int = 100
+    supported_features: FanEntityFeature | None = None
+
+
+@REGISTRY.register(Platform.FAN)
+class FanEntity(HAEntity):
+    domain: Literal[Platform.FAN]
+    attributes: FanAttributes
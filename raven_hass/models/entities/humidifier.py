@@ -0,0 +1,38 @@
+from enum import IntFlag, StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class HumidifierDeviceClass(StrEnum):
+    HUMIDIFIER = "humidifier"
+    DEHUMIDIFIER = "dehumidifier"
+
+
+class HumidifierAction(StrEnum):
+    HUMIDIFYING = "humidifying"
+    DRYING = "drying"
+    IDLE = "idle"
+    OFF = "off"
+
+
+class HumidifierEntityFeature(IntFlag):
+    MODES = 1
+
+
+class HumidifierAttributes(BaseAttributes):
+    action: HumidifierAction | None = None
+    available_modes: list[str] | None = None
+    current_humidity: float | None = None
+    device_class: HumidifierDeviceClass | None = None
+    is_on: bool | None = None
+    max_humidity: float = 100
+    min_humidity: float = 0
+    mode: str | None = None
+    target_humidity: float | None = None
+    supported_features: HumidifierEntityFeature | None = None
+
+
+@REGISTRY.register(Platform.HUMIDIFIER)
+class HumidifierEntity(HAEntity):
+    domain: Literal[Platform.HUMIDIFIER]
+    attributes: HumidifierAttributes
@@ -0,0 +1,15 @@
+from datetime import datetime
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class ImageAttributes(BaseAttributes):
+    content_type: str = "image/jpeg"
+    image_last_updated: datetime | None = None
+    image_url: str | None = None
+
+
+@REGISTRY.register(Platform.IMAGE)
+class ImageEntity(HAEntity):
+    domain: Literal[Platform.IMAGE]
+    attributes: ImageAttributes
@@ -0,0 +1,27 @@
+from enum import IntFlag, StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class LawnMowerActivity(StrEnum):
+    ERROR = "error"
+    PAUSED = "paused"
+    MOWING = "mowing"
+    DOCKED = "docked"
+
+
+class LawnMowerEntityFeature(IntFlag):
+    START_MOWING = 1
+    PAUSE = 2
+    DOCK = 4
+
+
+class LawnMowerAttributes(BaseAttributes):
+    activity: LawnMowerActivity | None = None
+    supported_features: LawnMowerEntityFeature | None = None
+
+
+@REGISTRY.register(Platform.LAWN_MOWER)
+class LawnMowerEntity(HAEntity):
+    domain: Literal[Platform.LAWN_MOWER]
+    attributes: LawnMowerAttributes
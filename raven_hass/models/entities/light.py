@@ -0,0 +1,46 @@
+from enum import IntFlag, StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class LightEntityFeature(IntFlag):
+    EFFECT = 4
+    FLASH = 8
+    TRANSITION = 32
+
+
+class ColorMode(StrEnum):
+    UNKNOWN = "unknown"
+    ONOFF = "onoff"
+    BRIGHTNESS = "brightness"
+    COLOR_TEMP = "color_temp"
+    HS = "hs"
+    XY = "xy"
+    RGB = "rgb"
+    RGBW = "rgbw"
+    RGBWW = "rgbww"
+    WHITE = "white"
+
+
+class LightAttributes(BaseAttributes):
+    brightness: int | None = None
+    color_mode: ColorMode | None = None
+    color_temp_kelvin: int | None = None
+    effect: str | None = None
+    effect_list: list[str] | None = None
+    hs_color: tuple[float, float] | None = None
+    is_on: bool | None = None
+    max_color_temp_kelvin: int | None = None
+    min_color_temp_kelvin: int | None = None
+    rgb_color: tuple[int, int, int] | None = None
+    rgbw_color: tuple[int, int, int, int] | None = None
+    rgbww_color: tuple[int, int, int, int, int] | None = None
+    supported_color_modes: list[ColorMode] | None = None
+    xy_color: tuple[float, float] | None = None
+    supported_features: LightEntityFeature | None = None
+
+
+@REGISTRY.register(Platform.LIGHT)
+class LightEntity(HAEntity):
+    domain: Literal[Platform.LIGHT]
+    attributes: LightAttributes
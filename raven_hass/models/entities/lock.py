@@ -0,0 +1,25 @@
+from enum import IntFlag
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class LockFeatures(IntFlag):
+    OPEN = 1
+
+
+class LockAttributes(BaseAttributes):
+    changed_by: str | None = None
+    code_format: str | None = None
+    is_locked: bool | None = None
+    is_locking: bool | None = None
+    is_unlocking: bool | None = None
+    is_jammed: bool | None = None
+    is_opening: bool | None = None
+    is_open: bool | None = None
+    supported_features: LockFeatures | None = None
+
+
+@REGISTRY.register(Platform.LOCK)
+class LockEntity(HAEntity):
+    domain: Literal[Platform.LOCK]
+    attributes: LockAttributes
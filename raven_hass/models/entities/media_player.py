@@ -0,0 +1,152 @@
+from datetime import datetime
+from enum import IntFlag, StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class MediaPlayerState(StrEnum):
+    """State of media player entities."""
+
+    OFF = "off"
+    ON = "on"
+    IDLE = "idle"
+    PLAYING = "playing"
+    PAUSED = "paused"
+    STANDBY = "standby"
+    BUFFERING = "buffering"
+
+
+class MediaClass(StrEnum):
+    """Media class for media player entities."""
+
+    ALBUM = "album"
+    APP = "app"
+    ARTIST = "artist"
+    CHANNEL = "channel"
+    COMPOSER = "composer"
+    CONTRIBUTING_ARTIST = "contributing_artist"
+    DIRECTORY = "directory"
+    EPISODE = "episode"
+    GAME = "game"
+    GENRE = "genre"
+    IMAGE = "image"
+    MOVIE = "movie"
+    MUSIC = "music"
+    PLAYLIST = "playlist"
+    PODCAST = "podcast"
+    SEASON = "season"
+    TRACK = "track"
+    TV_SHOW = "tv_show"
+    URL = "url"
+    VIDEO = "video"
+
+
+class MediaType(StrEnum):
+    """Media type for media player entities."""
+
+    ALBUM = "album"
+    APP = "app"
+    APPS = "apps"
+    ARTIST = "artist"
+    CHANNEL = "channel"
+    CHANNELS = "channels"
+    COMPOSER = "composer"
+    CONTRIBUTING_ARTIST = "contributing_artist"
+    EPISODE = "episode"
+    GAME = "game"
+    GENRE = "genre"
+    IMAGE = "image"
+    MOVIE = "movie"
+    MUSIC = "music"
+    PLAYLIST = "playlist"
+    PODCAST = "podcast"
+    SEASON = "season"
+    TRACK = "track"
+    TVSHOW = "tvshow"
+    URL = "url"
+    VIDEO = "video"
+
+
+class RepeatMode(StrEnum):
+    """Repeat mode for media player entities."""
+
+    ALL = "all"
+    OFF = "off"
+    ONE = "one"
+
+
+class MediaPlayerEntityFeature(IntFlag):
+    """Supported features of the media player entity."""
+
+    PAUSE = 1
+    SEEK = 2
+    VOLUME_SET = 4
+    VOLUME_MUTE = 8
+    PREVIOUS_TRACK = 16
+    NEXT_TRACK = 32
+
+    TURN_ON = 128
+    TURN_OFF = 256
+    PLAY_MEDIA = 512
+    VOLUME_STEP = 1024
+    SELECT_SOURCE = 2048
+    STOP = 4096
+    CLEAR_PLAYLIST = 8192
+    PLAY = 16384
+    SHUFFLE_SET = 32768
+    SELECT_SOUND_MODE = 65536
+    BROWSE_MEDIA = 131072
+    REPEAT_SET = 262144
+    GROUPING = 524288
+    MEDIA_ANNOUNCE = 1048576
+    MEDIA_ENQUEUE = 2097152
+
+
+class MediaPlayerDeviceClass(StrEnum):
+    """Device class for media players."""
+
+    TV = "tv"
+    SPEAKER = "speaker"
+    RECEIVER = "receiver"
+
+
+class MediaPlayerAttributes(BaseAttributes):
+    app_id: str | None = None
+    app_name: str | None = None
+    device_class: MediaPlayerDeviceClass
+    group_members: list[str] | None = None
+    is_volume_muted: bool | None = None
+    media_album_artist: str | None = None
+    media_album_name: str | None = None
+    media_artist: str | None = None
+    media_channel: str | None = None
+    media_content_id: str | None = None
+    media_content_type: MediaType | str | None = None
+    media_duration: int | None = None
+    media_episode: str | None = None
+    media_image_hash: str | None = None
+    media_image_remotely_accessible: bool | None = None
+    media_image_url: str | None = None
+    media_playlist: str | None = None
+    media_position: int | None = None
+    media_position_updated_at: datetime | None = None
+    media_season: str | None = None
+    media_series_title: str | None = None
+    media_title: str | None = None
+    media_track: int | None = None
+    repeat: RepeatMode | str | None = None
+    shuffle: bool | None = None
+    sound_mode: str | None = None
+    sound_mode_list: list[str] | None = None
+    source: str | None = None
+    source_list: list[str] | None = None
+    state: MediaPlayerState | None = None
+    volume_level: float | None = None
+    volute_step: float | None = 0.1
+    supported_features: MediaPlayerEntityFeature | None = None
+
+
+@REGISTRY.register(Platform.MEDIA_PLAYER)
+class MediaPlayerEntity(HAEntity):
+    domain: Literal[Platform.MEDIA_PLAYER]
+    attributes: MediaPlayerAttributes
@@ -0,0 +1,7 @@
+from typing import Literal
+from .base import REGISTRY, HAEntity, Platform
+
+
+@REGISTRY.register(Platform.NOTIFY)
+class NotifyEntity(HAEntity):
+    domain: Literal[Platform.NOTIFY]
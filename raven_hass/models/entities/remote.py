@@ -0,0 +1,23 @@
+from enum import IntFlag
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class RemoteEntityFeature(IntFlag):
+    """Supported features of the remote entity."""
+
+    LEARN_COMMAND = 1
+    DELETE_COMMAND = 2
+    ACTIVITY = 4
+
+
+class RemoteAttributes(BaseAttributes):
+    supported_features: RemoteEntityFeature | None = None
+    current_activity: str | None = None
+    activity_list: list[str] | None = None
+
+
+@REGISTRY.register(Platform.REMOTE)
+class RemoteEntity(HAEntity):
+    domain: Literal[Platform.REMOTE]
+    attributes: RemoteAttributes
@@ -0,0 +1,7 @@
+from typing import Literal
+from .base import REGISTRY, HAEntity, Platform
+
+
+@REGISTRY.register(Platform.SCENE)
+class SceneEntity(HAEntity):
+    domain: Literal[Platform.SCENE]
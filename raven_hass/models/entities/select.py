@@ -0,0 +1,16 @@
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class SelectAttributes(BaseAttributes):
+    current_option: str | None = None
+    options: list[str] = []
+
+
+@REGISTRY.register(Platform.SELECT, "input_select")
+class SelectEntity(HAEntity):
+    domain: Literal[Platform.SELECT]
+    attributes: SelectAttributes
+
+    def is_domain(self, domain: str) -> bool:
+        return domain in [Platform.SELECT, "input_select"]
@@ -0,0 +1,28 @@
+from datetime import datetime
+from enum import StrEnum
+from typing import Any, Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+from .number import NumericalDeviceClass
+
+
+class SensorStateClass(StrEnum):
+    MEASUREMENT = "measurement"
+    TOTAL = "total"
+    TOTAL_INCREASING = "total_increasing"
+
+
+class SensorAttributes(BaseAttributes):
+    device_class: NumericalDeviceClass | str | None = None
+    last_reset: datetime | None = None
+    native_unit_of_measurement: str | None = None
+    native_value: Any = None
+    options: list | None = None
+    state_class: SensorStateClass | str | None = None
+    suggested_display_precision: int | None = None
+    suggested_unit_of_measurement: str | None = None
+
+
+@REGISTRY.register(Platform.SENSOR)
+class SensorEntity(HAEntity):
+    domain: Literal[Platform.SENSOR]
+    attributes: SensorAttributes
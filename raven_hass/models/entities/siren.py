@@ -0,0 +1,25 @@
+from enum import IntFlag
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class SirenEntityFeature(IntFlag):
+    """Supported features of the siren entity."""
+
+    TURN_ON = 1
+    TURN_OFF = 2
+    TONES = 4
+    VOLUME_SET = 8
+    DURATION = 16
+
+
+class SirenAttributes(BaseAttributes):
+    is_on: bool | None = None
+    available_tones: list | dict | None = None
+    supported_features: SirenEntityFeature | None = None
+
+
+@REGISTRY.register(Platform.SIREN)
+class SirenEntity(HAEntity):
+    domain: Literal[Platform.SIREN]
+    attributes: SirenAttributes
@@ -0,0 +1,69 @@
+from enum import IntEnum, StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class AudioCodecs(StrEnum):
+    """Supported Audio codecs."""
+
+    PCM = "pcm"
+    OPUS = "opus"
+
+
+class AudioFormats(StrEnum):
+    """Supported Audio formats."""
+
+    WAV = "wav"
+    OGG = "ogg"
+
+
+class AudioBitRates(IntEnum):
+    """Supported Audio bit rates."""
+
+    BITRATE_8 = 8
+    BITRATE_16 = 16
+    BITRATE_24 = 24
+    BITRATE_32 = 32
+
+
+class AudioSampleRates(IntEnum):
+    """Supported Audio sample rates."""
+
+    SAMPLERATE_8000 = 8000
+    SAMPLERATE_11000 = 11000
+    SAMPLERATE_16000 = 16000
+    SAMPLERATE_18900 = 18900
+    SAMPLERATE_22000 = 22000
+    SAMPLERATE_32000 = 32000
+    SAMPLERATE_37800 = 37800
+    SAMPLERATE_44100 = 44100
+    SAMPLERATE_48000 = 48000
+
+
+class AudioChannels(IntEnum):
+    """Supported Audio channel."""
+
+    CHANNEL_MONO = 1
+    CHANNEL_STEREO = 2
+
+
+class SpeechResultState(StrEnum):
+    """Result state of speech."""
+
+    SUCCESS = "success"
+    ERROR = "error"
+
+
+class STTAttributes(BaseAttributes):
+    supported_languages: list[str] = []
+    supported_formats: list[AudioFormats] = []
+    supported_codecs: list[AudioCodecs] = []
+    supported_bit_rates: list[AudioBitRates] = []
+    supported_sample_rates: list[AudioSampleRates] = []
+    supported_channels: list[AudioChannels]
+
+
+@REGISTRY.register(Platform.STT)
+class STTEntity(HAEntity):
+    domain: Literal[Platform.STT]
+    attributes: STTAttributes
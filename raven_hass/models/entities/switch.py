@@ -0,0 +1,22 @@
+from enum import StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class SwitchDeviceClass(StrEnum):
+    OUTLET = "outlet"
+    SWITCH = "switch"
+
+
+class SwitchAttributes(BaseAttributes):
+    is_on: bool | None = None
+    device_class: SwitchDeviceClass | None = None
+
+
+@REGISTRY.register(Platform.SWITCH, "input_boolean")
+class SwitchEntity(HAEntity):
+    domain: Literal[Platform.SWITCH]
+    attributes: SwitchAttributes
+
+    def is_domain(self, domain: str) -> bool:
+        return domain in [Platform.SWITCH, "input_boolean"]
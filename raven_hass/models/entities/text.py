@@ -0,0 +1,25 @@
+from enum import StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class TextMode(StrEnum):
+    TEXT = "text"
+    PASSWORD = "password"
+
+
+class TextAttributes(BaseAttributes):
+    mode: TextMode = TextMode.TEXT
+    native_max: int = 100
+    native_min: int = 0
+    pattern: str | None = None
+    native_value: str = ""
+
+
+@REGISTRY.register(Platform.TEXT, "input_text")
+class TextEntity(HAEntity):
+    domain: Literal[Platform.TEXT]
+    attributes: TextAttributes
+
+    def is_domain(self, domain: str) -> bool:
+        return domain in [Platform.TEXT, "input_text"]
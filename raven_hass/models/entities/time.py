@@ -0,0 +1,13 @@
+from datetime import time
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class TimeAttributes(BaseAttributes):
+    native_value: time | None = None
+
+
+@REGISTRY.register(Platform.TIME)
+class TimeEntity(HAEntity):
+    domain: Literal[Platform.TIME]
+    attributes: TimeAttributes
@@ -0,0 +1,46 @@
+from datetime import date, datetime
+from enum import IntFlag, StrEnum
+from typing import Literal
+from pydantic import BaseModel
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class TodoListEntityFeature(IntFlag):
+    """Supported features of the To-do List entity."""
+
+    CREATE_TODO_ITEM = 1
+    DELETE_TODO_ITEM = 2
+    UPDATE_TODO_ITEM = 4
+    MOVE_TODO_ITEM = 8
+    SET_DUE_DATE_ON_ITEM = 16
+    SET_DUE_DATETIME_ON_ITEM = 32
+    SET_DESCRIPTION_ON_ITEM = 64
+
+
+class TodoItemStatus(StrEnum):
+    """Status or confirmation of a To-do List Item.
+
+    This is a subset of the statuses supported in rfc5545.
+    """
+
+    NEEDS_ACTION = "needs_action"
+    COMPLETED = "completed"
+
+
+class TodoListItem(BaseModel):
+    uid: str | None = None
+    summary: str | None = None
+    status: TodoItemStatus | None = None
+    due: date | datetime | None = None
+    description: str | None = None
+
+
+class TodoListAttributes(BaseAttributes):
+    todo_items: list[TodoListItem] | None = None
+    supported_features: TodoListEntityFeature | None = None
+
+
+@REGISTRY.register(Platform.TODO)
+class TodoListEntity(HAEntity):
+    domain: Literal[Platform.TODO]
+    attributes: TodoListAttributes
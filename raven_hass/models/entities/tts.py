@@ -0,0 +1,15 @@
+from typing import Any, Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class TTSAttributes(BaseAttributes):
+    supported_languages: list[str] = []
+    default_language: str | None = None
+    supported_options: list[str] | None = None
+    default_options: dict[str, Any] | None = None
+
+
+@REGISTRY.register(Platform.TTS)
+class TTSEntity(HAEntity):
+    domain: Literal[Platform.TTS]
+    attributes: TTSAttributes
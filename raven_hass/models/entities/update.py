@@ -0,0 +1,37 @@
+from enum import IntFlag, StrEnum
+from typing import Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class UpdateEntityFeature(IntFlag):
+    """Supported features of the update entity."""
+
+    INSTALL = 1
+    SPECIFIC_VERSION = 2
+    PROGRESS = 4
+    BACKUP = 8
+    RELEASE_NOTES = 16
+
+
+class UpdateDeviceClass(StrEnum):
+    """Device class for update."""
+
+    FIRMWARE = "firmware"
+
+
+class UpdateAttributes(BaseAttributes):
+    auto_update: bool = False
+    in_progress: bool | int | None = None
+    installed_version: str | None = None
+    latest_version: str | None = None
+    release_summary: str | None = None
+    release_url: str | None = None
+    title: str | None = None
+    supported_features: UpdateEntityFeature | None = None
+    device_class: UpdateDeviceClass | None = None
+
+
+@REGISTRY.register(Platform.UPDATE)
+class UpdateEntity(HAEntity):
+    domain: Literal[Platform.UPDATE]
+    attributes: UpdateAttributes
@@ -0,0 +1,46 @@
+from enum import IntFlag, StrEnum
+from typing import Any, Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class VacuumEntityFeature(IntFlag):
+    """Supported features of the vacuum entity."""
+
+    TURN_ON = 1  # Deprecated, not supported by StateVacuumEntity
+    TURN_OFF = 2  # Deprecated, not supported by StateVacuumEntity
+    PAUSE = 4
+    STOP = 8
+    RETURN_HOME = 16
+    FAN_SPEED = 32
+    BATTERY = 64
+    STATUS = 128  # Deprecated, not supported by StateVacuumEntity
+    SEND_COMMAND = 256
+    LOCATE = 512
+    CLEAN_SPOT = 1024
+    MAP = 2048
+    STATE = 4096  # Must be set by vacuum platforms derived from StateVacuumEntity
+    START = 8192
+
+
+class VacuumEntityState(StrEnum):
+    CLEANING = "cleaning"
+    DOCKED = "docked"
+    RETURNING = "returning"
+    ERROR = "error"
+
+
+class VacuumAttributes(BaseAttributes):
+    battery_icon: str | None = None
+    battery_level: int | None = None
+    fan_speed: str | None = None
+    fan_speed_list: list | None = None
+    name: str | None = None
+    state: VacuumEntityState | None = None
+    supported_features: VacuumEntityFeature | None = None
+
+
+@REGISTRY.register(Platform.VACUUM)
+class VacuumEntity(HAEntity):
+    domain: Literal[Platform.VACUUM]
+    attributes: VacuumAttributes
+    state: VacuumEntityState | Any
@@ -0,0 +1,46 @@
+from enum import IntFlag, StrEnum
+from typing import Any, Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class ValveDeviceClass(StrEnum):
+    """Device class for valve."""
+
+    # Refer to the valve dev docs for device class descriptions
+    WATER = "water"
+    GAS = "gas"
+
+
+# mypy: disallow-any-generics
+class ValveEntityFeature(IntFlag):
+    """Supported features of the valve entity."""
+
+    OPEN = 1
+    CLOSE = 2
+    SET_POSITION = 4
+    STOP = 8
+
+
+class ValveState(StrEnum):
+    OPENING = "opening"
+    OPEN = "open"
+    CLOSING = "closing"
+    CLOSED = "closed"
+
+
+class ValveAttributes(BaseAttributes):
+    current_valve_position: int | None = None
+    is_closed: bool | None = None
+    is_closing: bool | None = None
+    is_opening: bool | None = None
+    reports_position: bool = False
+    device_class: ValveDeviceClass | None = None
+    supported_features: ValveEntityFeature | None = None
+    state: ValveState | None = None
+
+
+@REGISTRY.register(Platform.VALVE)
+class ValveEntity(HAEntity):
+    domain: Literal[Platform.VALVE]
+    attributes: ValveAttributes
+    state: ValveState | Any
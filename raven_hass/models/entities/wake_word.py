@@ -0,0 +1,19 @@
+from typing import Literal
+from pydantic import BaseModel
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class WakeWord(BaseModel):
+    id: str | None = None
+    name: str | None = None
+    phrase: str | None = None
+
+
+class WakeWordAttributes(BaseAttributes):
+    supported_wake_words: list[WakeWord] = []
+
+
+@REGISTRY.register(Platform.WAKE_WORD)
+class WakeWordEntity(HAEntity):
+    domain: Literal[Platform.WAKE_WORD]
+    attributes: WakeWordAttributes
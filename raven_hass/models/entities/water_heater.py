@@ -0,0 +1,42 @@
+from enum import IntFlag, StrEnum
+from typing import Any, Literal
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform, UnitOfTemperature
+
+
+class WaterHeaterEntityFeature(IntFlag):
+    TARGET_TEMPERATURE = 1
+    OPERATION_MODE = 2
+    AWAY_MODE = 4
+    ON_OFF = 8
+
+
+class WaterHeaterStates(StrEnum):
+    ECO = "eco"
+    ELECTRIC = "electric"
+    PERFORMANCE = "performance"
+    HIGH_DEMAND = "high_demand"
+    HEAT_PUMP = "heat_pump"
+    GAS = "gas"
+    OFF = "off"
+
+
+class WaterHeaterAttributes(BaseAttributes):
+    min_temp: float = 110
+    max_temp: float = 140
+    current_temperature: float | None = None
+    target_temperature: float | None = None
+    target_temperature_high: float | None = None
+    target_temperature_low: float | None = None
+    temperature_unit: str | UnitOfTemperature | None = None
+    current_operation: str | None = None
+    operation_list: list[str] | None = None
+    supported_features: WaterHeaterEntityFeature | None = None
+    is_away_mode_on: bool | None = None
+    state: WaterHeaterStates | Any = None
+
+
+@REGISTRY.register(Platform.WATER_HEATER)
+class WaterHeaterEntity(HAEntity):
+    domain: Literal[Platform.WATER_HEATER]
+    attributes: WaterHeaterAttributes
+    state: WaterHeaterStates | Any
@@ -0,0 +1,69 @@
+from datetime import datetime
+from enum import IntFlag
+from typing import Literal
+from pydantic import BaseModel
+from .base import REGISTRY, BaseAttributes, HAEntity, Platform
+
+
+class WeatherEntityFeature(IntFlag):
+    """Supported features of the update entity."""
+
+    FORECAST_DAILY = 1
+    FORECAST_HOURLY = 2
+    FORECAST_TWICE_DAILY = 4
+
+
+class WeatherForecast(BaseModel):
+    condition: str | None = None
+    datetime: str | None = None
+    humidity: float | None = None
+    precipitation_probability: float | None = None
+    cloud_coverage: float | None = None
+    native_precipitation: float | None = None
+    precipitation: float | None = None
+    native_pressure: float | None = None
+    pressure: float | None = None
+    native_temperature: float | None = None
+    temperature: float | None = None
+    native_templow: float | None = None
+    templow: float | None = None
+    native_apparent_temperature: float | None = None
+    wind_bearing: float | str | None = None
+    native_wind_gust_speed: float | None = None
+    native_wind_speed: float | None = None
+    wind_speed: float | None = None
+    native_dew_point: float | None = None
+    uv_index: float | None = None
+    is_daytime: bool | None = None
+
+
+class WeatherAttributes(BaseAttributes):
+    condition: str | None = None
+    datetime: str | None = None
+    humidity: float | None = None
+    precipitation_probability: float | None = None
+    cloud_coverage: float | None = None
+    native_precipitation: float | None = None
+    precipitation: float | None = None
+    native_pressure: float | None = None
+    pressure: float | None = None
+    native_temperature: float | None = None
+    temperature: float | None = None
+    native_templow: float | None = None
+    templow: float | None = None
+    native_apparent_temperature: float | None = None
+    wind_bearing: float | str | None = None
+    native_wind_gust_speed: float | None = None
+    native_wind_speed: float | None = None
+    wind_speed: float | None = None
+    native_dew_point: float | None = None
+    uv_index: float | None = None
+    is_daytime: bool | None = None
+    ozone: float | None = None
+    forecast: list[WeatherForecast] | None = None
+
+
+@REGISTRY.register(Platform.WEATHER)
+class WeatherEntity(HAEntity):
+    domain: Literal[Platform.WEATHER]
+    attributes: WeatherAttributes
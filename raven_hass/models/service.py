@@ -1,7 +1,7 @@
 from enum import StrEnum
-from typing import Any, ClassVar, Literal
-from pydantic import BaseModel, Field, field_validator
-from .util import Registry, RegisteredModel
+from typing import Any, ClassVar, Literal, Self
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from .util import BoundModel, Registry, RegisteredModel
 
 
 class EntityFilterSelectorConfig(BaseModel):
@@ -342,6 +342,8 @@ SelectorTypes = (
 
 
 class ServiceField(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     name: str | None = None
     description: str | None = None
@@ -351,27 +353,22 @@ class ServiceField(BaseModel):
     filter: dict | None = None
     selector: SelectorTypes | None = Field(default=None, discriminator="selector_type")
 
+    # Only tags the raw selector; the SelectorTypes union then validates it once
     @field_validator("selector", mode="before")
     @classmethod
-    def transform_selector(cls, v: any) -> SelectorTypes | None:
+    def transform_selector(cls, v: any) -> dict | SelectorTypes | None:
         if isinstance(v, dict):
             if "selector_type" in v.keys():
-                constructor = REGISTRY[v["selector_type"]]
-                if constructor:
-                    return constructor(**v)
-                return None
+                return v if v["selector_type"] in REGISTRY.registry else None
             if len(v.keys()) > 0:
-                key = list(v.keys())[0]
-
-                constructor = REGISTRY[key]
-                if constructor:
-                    return constructor(selector_type=key, **v)
-                return None
+                key = next(iter(v))
+                return {"selector_type": key, **v} if key in REGISTRY.registry else None
         return v
 
 
-class Service(BaseModel):
-    _client: ClassVar[Any] = None
+class Service(BoundModel):
+    model_config = ConfigDict(defer_build=True)
+
     domain: str
     service: str
     name: str
@@ -379,29 +376,40 @@ class Service(BaseModel):
     target: dict[str, Any] = {}
     fields: dict[str, ServiceField] = {}
 
+    _list_adapter: ClassVar[TypeAdapter[list["Service"]] | None] = None
+
     @field_validator("fields", mode="before")
     @classmethod
-    def give_fields_ids(cls, v: Any) -> dict[str, ServiceField]:
+    def give_fields_ids(cls, v: Any) -> dict[str, dict | ServiceField]:
         if isinstance(v, dict):
             resolved = {}
             for key, val in v.items():
                 if isinstance(val, ServiceField):
                     resolved[key] = val
                 elif val == None:
-                    resolved[key] = ServiceField(id=key)
+                    resolved[key] = {"id": key}
                 elif isinstance(val, dict):
-                    resolved[key] = ServiceField(id=key, **val)
+                    resolved[key] = {"id": key, **val}
             return resolved
         return v
 
-    @classmethod
-    def from_services(cls, services: dict[str, dict[str, Any]]) -> list["Service"]:
-        results = []
-        for domain, domain_services in services.items():
-            for service_name, service in domain_services.items():
-                results.append(Service(domain=domain, service=service_name, **service))
-        return results
+    def bind(self, client: Any) -> Self:
+        for field in self.fields.values():
+            if field.selector != None:
+                field.selector.bind(client)
+        return super().bind(client)
 
     @classmethod
-    def set_client(cls, client: Any):
-        cls._client = client
+    def from_services(
+        cls, services: dict[str, dict[str, Any]], client: Any = None
+    ) -> list["Service"]:
+        if not cls._list_adapter:
+            cls._list_adapter = TypeAdapter(list[Service])
+        return cls._list_adapter.validate_python(
+            [
+                {"domain": domain, "service": service_name, **service}
+                for domain, domain_services in services.items()
+                for service_name, service in domain_services.items()
+            ],
+            context={"client": client},
+        )
@@ -1,24 +1,36 @@
-from typing import Any, ClassVar, Type
+from importlib import import_module
+from threading import RLock
+from typing import Any, ClassVar, Self, Type
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 
-class RegisteredModel(BaseModel):
-    _client: ClassVar[Any] = None
-    _registry: ClassVar["Registry"] = None
+class BoundModel(BaseModel):
+    _client: Any = PrivateAttr(default=None)
 
-    @classmethod
-    def set_client(cls, client: Any):
-        cls._client = client
+    # Validating with context={"client": ...} binds this model and every nested one
+    def model_post_init(self, context: Any, /):
+        if isinstance(context, dict):
+            self._client = context.get("client")
 
-    @classmethod
-    def set_registry(cls, registry: "Registry"):
-        cls._registry = registry
+    def bind(self, client: Any) -> Self:
+        self._client = client
+        return self
 
     @property
     def client(self) -> Any:
         return self._client
 
+
+class RegisteredModel(BoundModel):
+    # Schemas are built by Registry on first lookup instead of at import
+    model_config = ConfigDict(defer_build=True)
+    _registry: ClassVar["Registry"] = None
+
+    @classmethod
+    def set_registry(cls, registry: "Registry"):
+        cls._registry = registry
+
     @property
     def registry(self) -> "Registry | None":
         return self._registry
@@ -27,6 +39,13 @@ class RegisteredModel(BaseModel):
 class Registry:
     def __init__(self):
         self.registry: dict[str, RegisteredModel] = {}
+        self.deferred: dict[str, str] = {}
+        # Lookups also run on executor threads when decoding is offloaded
+        self._lock = RLock()
+
+    def defer(self, module: str, *keys: str):
+        for key in keys:
+            self.deferred[key] = module
 
     def register(self, *keys: str):
         if len(keys) == 0:
@@ -35,15 +54,20 @@ class Registry:
         def register_inner[T](original_class: Type[T]):
             for key in keys:
                 original_class.set_registry(self)
-                original_class.model_rebuild()
                 self.registry[key] = original_class
             return original_class
 
         return register_inner
 
     def __getitem__(self, key: str):
-        return self.registry.get(key, None)
+        model = self.registry.get(key, None)
+        if model and model.__pydantic_complete__:
+            return model
 
-    def assign_client(self, client: Any):
-        for v in self.registry.values():
-            v.set_client(client)
+        with self._lock:
+            if not key in self.registry and key in self.deferred:
+                import_module(self.deferred.pop(key))
+            model = self.registry.get(key, None)
+            if model and not model.__pydantic_complete__:
+                model.model_rebuild()
+            return model
@@ -1,5 +1,5 @@
 from typing import Any, Literal, Type
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class WSMessage(BaseModel):
@@ -29,9 +29,79 @@ class WSResult[T](WSMessage):
     error: Any | None = None
 
 
+class WSResubscribed(WSMessage):
+    type: Literal["resubscribed"] = "resubscribed"
+
+
+class WSBatchResult(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    results: list[WSResult | None]
+    exceptions: dict[int, Exception] = {}
+
+    @property
+    def success(self) -> bool:
+        return all(result and result.success for result in self.results)
+
+    @property
+    def failures(self) -> dict[int, WSResult | Exception]:
+        return {
+            index: self.exceptions.get(index, result)
+            for index, result in enumerate(self.results)
+            if not (result and result.success)
+        }
+
+
 class WSEvent(WSMessage):
     type: Literal["event"]
     event: Any
+    backfilled: bool = False
+
+    @property
+    def event_type(self) -> str | None:
+        return self.event.get("event_type") if isinstance(self.event, dict) else None
+
+    @property
+    def entity_id(self) -> str | None:
+        if isinstance(self.event, dict) and isinstance(self.event.get("data"), dict):
+            return self.event["data"].get("entity_id")
+        return None
+
+    def conflation_key(self) -> tuple[str | None, str] | None:
+        entity_id = self.entity_id
+        return (self.event_type, entity_id) if entity_id else None
+
+    def merge(self, newer: "WSEvent") -> "WSEvent":
+        if newer.event_type == "state_changed":
+            data = {**newer.event["data"], "old_state": self.event["data"]["old_state"]}
+            return newer.model_copy(update={"event": {**newer.event, "data": data}})
+        return newer
+
+
+class CompressedState(BaseModel):
+    state: Any = Field(default=None, alias="s")
+    attributes: dict[str, Any] = Field(default={}, alias="a")
+    context: str | dict[str, Any] | None = Field(default=None, alias="c")
+    last_changed: float | None = Field(default=None, alias="lc")
+    last_updated: float | None = Field(default=None, alias="lu")
+
+
+class CompressedStateRemovals(BaseModel):
+    attributes: list[str] = Field(default=[], alias="a")
+
+
+class CompressedStateDiff(BaseModel):
+    additions: CompressedState | None = Field(default=None, alias="+")
+    removals: CompressedStateRemovals | None = Field(default=None, alias="-")
+
+
+class EntityStreamEvent(BaseModel):
+    added: dict[str, CompressedState] = Field(default={}, alias="a")
+    changed: dict[str, CompressedStateDiff] = Field(default={}, alias="c")
+    removed: list[str] = Field(default=[], alias="r")
+
+
+class WSPong(WSMessage):
+    type: Literal["pong"]
 
 
 WS_MESSAGE_TYPES: dict[str, Type[WSMessage]] = {
@@ -40,4 +110,5 @@ WS_MESSAGE_TYPES: dict[str, Type[WSMessage]] = {
     "auth_invalid": WSAuthResult,
     "result": WSResult,
     "event": WSEvent,
+    "pong": WSPong,
 }
@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Any
+from .backfill import history_events
+from .codec import JsonCodec
+from .models import HAEntity, Service, WSResult
+
+# Module-level so they can be pickled into a ProcessPoolExecutor. Models come
+# back unbound; the caller binds them to its client.
+
+
+def decode_result(reply: WSResult | str | bytes, codec: JsonCodec) -> WSResult:
+    if isinstance(reply, WSResult):
+        return reply
+    return WSResult(**codec.loads(reply))
+
+
+def load_entities(
+    reply: WSResult | str | bytes, codec: JsonCodec, lazy: bool = False
+) -> list[HAEntity | None]:
+    result = decode_result(reply, codec)
+    if not result.success:
+        return []
+    return HAEntity.resolve_entities(result.result, lazy=lazy)
+
+
+def load_services(reply: WSResult | str | bytes, codec: JsonCodec) -> list[Service]:
+    result = decode_result(reply, codec)
+    if not result.success:
+        return []
+    return Service.from_services(result.result)
+
+
+def load_history(
+    reply: WSResult | str | bytes, codec: JsonCodec, start: datetime
+) -> list[dict[str, Any]]:
+    result = decode_result(reply, codec)
+    if not result.success or not isinstance(result.result, dict):
+        return []
+    return history_events(result.result, start)
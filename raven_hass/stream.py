@@ -0,0 +1,42 @@
+import re
+from json import JSONDecoder
+from typing import Any, Generator
+
+# Home Assistant writes successful results as {"id", "type", "success", "result"}
+# in that order, so the array can be located without decoding the frame
+RESULT_ARRAY = re.compile(
+    r'\s*\{\s*"id"\s*:\s*\d+\s*,\s*"type"\s*:\s*"result"\s*,'
+    r'\s*"success"\s*:\s*true\s*,\s*"result"\s*:\s*\['
+)
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+DECODER = JSONDecoder()
+
+
+def result_array_start(text: str) -> int | None:
+    match = RESULT_ARRAY.match(text)
+    return match.end() if match else None
+
+
+def iter_array(
+    text: str, position: int, chunk_size: int = 500
+) -> Generator[list[Any], Any, None]:
+    chunk: list[Any] = []
+    while True:
+        position = WHITESPACE.match(text, position).end()
+        if text[position] == "]":
+            break
+
+        item, position = DECODER.raw_decode(text, position)
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+
+        position = WHITESPACE.match(text, position).end()
+        if text[position] == ",":
+            position += 1
+        elif text[position] != "]":
+            raise ValueError(f"Expected ',' or ']' at position {position}")
+
+    if len(chunk) > 0:
+        yield chunk
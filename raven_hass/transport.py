@@ -0,0 +1,21 @@
+from httpx import AsyncHTTPTransport, Limits, Timeout
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+DEFAULT_LIMITS = Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=30
+)
+DEFAULT_TIMEOUT = Timeout(10, connect=5)
+
+
+def rest_transport(
+    limits: Limits | None = None, http2: bool | None = None
+) -> AsyncHTTPTransport:
+    # HTTP/2 is used whenever h2 is installed unless explicitly disabled
+    return AsyncHTTPTransport(
+        limits=limits or DEFAULT_LIMITS,
+        http2=h2 != None if http2 == None else http2,
+    )